@@ -16,6 +16,9 @@ Usage by Claude:
     # Mode 3: Show decision criteria (reference)
     python decision_helper.py --show-criteria [--format json]
 
+    # Mode 4: Persistent worker, one JSON request per stdin line
+    python decision_helper.py --serve
+
 References:
 - File 02: Skills vs Subagents conceptual differences
 - File 03: Decision tree logic and scoring
@@ -27,17 +30,313 @@ Version: 1.1 (Agent-Layer with text mode support)
 
 import json
 import sys
-import argparse
-from typing import Dict, List, Optional
+from functools import lru_cache
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Dict, Final, List, Mapping,
+    Optional, Set, Tuple, Union,
+)
 from pathlib import Path
 
-# Import shared utilities for standardized output
-try:
-    from utils.output_formatter import add_format_argument
-except ImportError:
-    # Fallback if utils not in path
-    sys.path.insert(0, str(Path(__file__).parent))
-    from utils.output_formatter import add_format_argument
+if TYPE_CHECKING:
+    import argparse
+
+# Import shared utilities for standardized output. Put this script's
+# directory on sys.path once up front (only if missing) instead of retrying
+# the import after an ImportError.
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from utils.output_formatter import (
+    add_format_argument, dumps_json_bytes, write_json
+)
+
+
+@dataclass(frozen=True)
+class Question:
+    """One decision-tree question (File 03) with its inference keywords."""
+    __slots__ = (
+        "question", "examples", "skill_keywords", "subagent_keywords",
+        "score_if_yes", "score_if_no"
+    )
+    
+    question: str
+    examples: Tuple[str, ...]
+    skill_keywords: Tuple[str, ...]
+    subagent_keywords: Tuple[str, ...]
+    score_if_yes: int
+    score_if_no: int
+
+
+# Decision questions with keywords for inference (File 03 decision tree).
+# Built once at import and shared read-only by every DecisionHelper.
+_QUESTIONS: Final[Mapping[str, Question]] = MappingProxyType({
+    "utility_task": Question(
+        question="Is it a utility/conversion/template task?",
+        examples=(
+            "Format conversion (JSON to CSV)",
+            "Data extraction from documents",
+            "Template application"
+        ),
+        skill_keywords=(
+            "convert", "transform", "template", "format",
+            "extract", "parse", "utility", "validation"
+        ),
+        subagent_keywords=(),
+        score_if_yes=+1,
+        score_if_no=-1
+    ),
+    "multi_step": Question(
+        question="Does it need multiple steps of reasoning?",
+        examples=(
+            "Code review with validation loops",
+            "Data analysis with hypothesis testing",
+            "Iterative refinement processes"
+        ),
+        skill_keywords=(),
+        subagent_keywords=(
+            "review", "analyze", "validate", "iterate",
+            "hypothesis", "decision", "multiple", "steps",
+            "refinement", "exploration"
+        ),
+        score_if_yes=-1,
+        score_if_no=+1
+    ),
+    "reusable": Question(
+        question="Will it be reused as building block?",
+        examples=(
+            "Document converter used by multiple workflows",
+            "Data parser for common formats",
+            "Shared utility function"
+        ),
+        skill_keywords=(
+            "reusable", "utility", "helper", "common",
+            "shared", "library", "building block"
+        ),
+        subagent_keywords=(),
+        score_if_yes=+1,
+        score_if_no=-1
+    ),
+    "specialized_personality": Question(
+        question="Does it need specialized personality?",
+        examples=(
+            "Security auditor with paranoid perspective",
+            "Code reviewer with strict standards",
+            "Domain expert with specific tone"
+        ),
+        skill_keywords=(),
+        subagent_keywords=(
+            "personality", "persona", "role", "expert",
+            "specialized", "tone", "perspective", "auditor"
+        ),
+        score_if_yes=-1,
+        score_if_no=+1
+    ),
+    "missing_knowledge": Question(
+        question="Is it knowledge Claude doesn't have?",
+        examples=(
+            "Company-specific procedures",
+            "Proprietary methodologies",
+            "Organizational standards"
+        ),
+        skill_keywords=(
+            "company", "proprietary", "organizational",
+            "internal", "procedure", "standard", "policy"
+        ),
+        subagent_keywords=(),
+        score_if_yes=+1,
+        score_if_no=0  # Neutral if Claude knows it
+    ),
+    "coordination": Question(
+        question="Does it coordinate operations with decision points?",
+        examples=(
+            "Multi-stage validation with branching",
+            "Orchestration with conditional logic",
+            "Workflow coordination"
+        ),
+        skill_keywords=(),
+        subagent_keywords=(
+            "coordinate", "orchestrate", "workflow", "pipeline",
+            "branching", "conditional", "decision points"
+        ),
+        score_if_yes=-1,
+        score_if_no=+1
+    ),
+    "isolated_context": Question(
+        question="Does it need isolated context?",
+        examples=(
+            "Long debugging session",
+            "Extensive exploration",
+            "Separate conversation thread"
+        ),
+        skill_keywords=(),
+        subagent_keywords=(
+            "isolated", "separate", "context", "independent",
+            "debugging", "exploration", "extensive"
+        ),
+        score_if_yes=-1,
+        score_if_no=+1
+    ),
+    "clutter_chat": Question(
+        question="Would it clutter main chat with intermediate steps?",
+        examples=(
+            "Security scan with 50+ findings",
+            "Comprehensive code analysis",
+            "Verbose intermediate output"
+        ),
+        skill_keywords=(),
+        subagent_keywords=(
+            "verbose", "detailed", "comprehensive", "extensive",
+            "many", "multiple outputs", "clutter"
+        ),
+        score_if_yes=-1,
+        score_if_no=+1
+    )
+})
+
+_REQUIRED_KEYS: Final[Tuple[str, ...]] = tuple(_QUESTIONS)
+_REQUIRED_KEYS_SET: Final[frozenset] = frozenset(_REQUIRED_KEYS)
+
+# (score_if_no, score_if_yes) per question, in _REQUIRED_KEYS order
+_SCORE_TABLE: Final[Tuple[Tuple[int, int], ...]] = tuple(
+    (q_data.score_if_no, q_data.score_if_yes) for q_data in _QUESTIONS.values()
+)
+
+
+def _reason_pair(q_data: Question) -> Tuple[str, str]:
+    """Format the (NO, YES) reasoning lines for one question."""
+    yes_direction = "favors Skill" if q_data.score_if_yes > 0 else "favors Subagent"
+    if q_data.score_if_no != 0:
+        no_direction = "favors Skill" if q_data.score_if_no > 0 else "favors Subagent"
+    else:
+        no_direction = "neutral"
+    
+    return (
+        f"{q_data.question} â†’ NO ({no_direction})",
+        f"{q_data.question} â†’ YES ({yes_direction})"
+    )
+
+
+# (reason_if_no, reason_if_yes) per question, in _REQUIRED_KEYS order
+_REASONS: Final[Tuple[Tuple[str, str], ...]] = tuple(
+    _reason_pair(q_data) for q_data in _QUESTIONS.values()
+)
+
+
+def _interpret_score(score: int) -> Tuple[str, float]:
+    """
+    Map a score to (recommendation, confidence) using the File 03 buckets.
+    
+    Only called at import to fill _RECOMMENDATION_BY_SCORE and
+    _CONFIDENCE_BY_SCORE; lookups at runtime are a single index.
+    """
+    if score >= 6:
+        recommendation = "Strong Skill"
+        confidence = 0.90 + (score - 6) * 0.025  # 90-95%
+    elif score >= 3:
+        recommendation = "Moderate Skill"
+        confidence = 0.75 + (score - 3) * 0.033  # 75-85%
+    elif score >= -1:
+        recommendation = "Hybrid Approach"
+        confidence = 0.60 + (score + 1) * 0.033  # 60-70%
+    elif score >= -5:
+        recommendation = "Moderate Subagent"
+        confidence = 0.75 + (abs(score) - 3) * 0.05  # 75-85%
+    else:
+        recommendation = "Strong Subagent"
+        confidence = 0.90 + (abs(score) - 6) * 0.025  # 90-95%
+    
+    return recommendation, round(confidence, 2)
+
+
+def _token_impact(score: int) -> Dict:
+    """
+    Estimate token costs for a score (File 05 figures).
+    
+    Only called at import to fill _TOKEN_IMPACT_BY_SCORE.
+    """
+    # Base estimates from File 05
+    if score >= 3:
+        # Skill-leaning recommendation
+        skill_cost = 500  # Typical skill invocation
+        subagent_cost = skill_cost * 15
+        note = "Skill approach significantly more token-efficient"
+    elif score <= -3:
+        # Subagent-leaning recommendation
+        subagent_cost = 7500  # Complex workflow
+        skill_cost = subagent_cost // 15
+        note = "High token cost justified for complex workflows"
+    else:
+        # Hybrid zone
+        skill_cost = 500
+        subagent_cost = 7500
+        note = "Consider hybrid: balance efficiency and capability"
+    
+    return {
+        "skill_approach_tokens": skill_cost,
+        "subagent_approach_tokens": subagent_cost,
+        "cost_multiplier": round(subagent_cost / skill_cost, 1),
+        "recommendation_note": note
+    }
+
+
+# Score-indexed lookup tables; index with score + 8 (scores span -8..+8)
+_RECOMMENDATION_BY_SCORE: Final[Tuple[str, ...]] = tuple(
+    _interpret_score(score)[0] for score in range(-8, 9)
+)
+_CONFIDENCE_BY_SCORE: Final[Tuple[float, ...]] = tuple(
+    _interpret_score(score)[1] for score in range(-8, 9)
+)
+_TOKEN_IMPACT_BY_SCORE: Final[Tuple[Mapping, ...]] = tuple(
+    MappingProxyType(_token_impact(score)) for score in range(-8, 9)
+)
+
+
+# Questions that favor Skills by default: utility, reusable, missing_knowledge
+_DEFAULT_YES: Final[Tuple[bool, ...]] = tuple(
+    q_id in ("utility_task", "reusable", "missing_knowledge") for q_id in _REQUIRED_KEYS
+)
+
+# (q_id, skill_keywords, subagent_keywords, default) per question, so keyword
+# inference walks flat tuples instead of re-reading the question objects
+_KEYWORD_ROWS: Final[Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...], bool], ...]] = tuple(
+    (q_id, tuple(q.skill_keywords), tuple(q.subagent_keywords), default)
+    for (q_id, q), default in zip(_QUESTIONS.items(), _DEFAULT_YES)
+)
+
+
+@lru_cache(maxsize=256)
+def _infer_cached(
+    text_lower: str
+) -> Tuple[Tuple[str, bool, Tuple[str, ...], Tuple[str, ...]], ...]:
+    """
+    Infer answers from an already normalized (stripped, lowercased) text.
+    
+    Cached because Claude often re-analyzes the same use case within a
+    session; results are immutable tuples so cache entries can't be
+    modified by callers.
+    
+    Returns:
+        One (q_id, answer, skill_matches, subagent_matches) row per question
+    """
+    # Plain substring tests over precomputed keyword tuples: the same checks
+    # the original per-question loop made, without its per-call lookups
+    rows = []
+    for q_id, skill_keywords, subagent_keywords, default in _KEYWORD_ROWS:
+        skill_matches = tuple([k for k in skill_keywords if k in text_lower])
+        subagent_matches = tuple([k for k in subagent_keywords if k in text_lower])
+        
+        # More hits on one side decides; a tie (incl. none) uses the default
+        if len(skill_matches) != len(subagent_matches):
+            answer = len(skill_matches) > len(subagent_matches)
+        else:
+            answer = default
+        
+        rows.append((q_id, answer, skill_matches, subagent_matches))
+    
+    return tuple(rows)
 
 
 class DecisionHelper:
@@ -48,137 +347,11 @@ class DecisionHelper:
     All input/output is JSON for programmatic parsing.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize decision helper with question definitions."""
-        self.answers: Dict[str, bool] = {}
+        self.answers: Mapping[str, bool] = {}
         self.score: int = 0
-        self.reasoning: List[str] = []
-        self.questions = self._define_questions()
-    
-    def _define_questions(self) -> Dict:
-        """
-        Define 8 decision questions with keywords for inference.
-        
-        Returns:
-            Dict mapping question IDs to question data
-            
-        References: File 03 (decision tree questions)
-        """
-        return {
-            "utility_task": {
-                "question": "Is it a utility/conversion/template task?",
-                "examples": [
-                    "Format conversion (JSON to CSV)",
-                    "Data extraction from documents",
-                    "Template application"
-                ],
-                "skill_keywords": [
-                    "convert", "transform", "template", "format",
-                    "extract", "parse", "utility", "validation"
-                ],
-                "score_if_yes": +1,
-                "score_if_no": -1
-            },
-            "multi_step": {
-                "question": "Does it need multiple steps of reasoning?",
-                "examples": [
-                    "Code review with validation loops",
-                    "Data analysis with hypothesis testing",
-                    "Iterative refinement processes"
-                ],
-                "subagent_keywords": [
-                    "review", "analyze", "validate", "iterate",
-                    "hypothesis", "decision", "multiple", "steps",
-                    "refinement", "exploration"
-                ],
-                "score_if_yes": -1,
-                "score_if_no": +1
-            },
-            "reusable": {
-                "question": "Will it be reused as building block?",
-                "examples": [
-                    "Document converter used by multiple workflows",
-                    "Data parser for common formats",
-                    "Shared utility function"
-                ],
-                "skill_keywords": [
-                    "reusable", "utility", "helper", "common",
-                    "shared", "library", "building block"
-                ],
-                "score_if_yes": +1,
-                "score_if_no": -1
-            },
-            "specialized_personality": {
-                "question": "Does it need specialized personality?",
-                "examples": [
-                    "Security auditor with paranoid perspective",
-                    "Code reviewer with strict standards",
-                    "Domain expert with specific tone"
-                ],
-                "subagent_keywords": [
-                    "personality", "persona", "role", "expert",
-                    "specialized", "tone", "perspective", "auditor"
-                ],
-                "score_if_yes": -1,
-                "score_if_no": +1
-            },
-            "missing_knowledge": {
-                "question": "Is it knowledge Claude doesn't have?",
-                "examples": [
-                    "Company-specific procedures",
-                    "Proprietary methodologies",
-                    "Organizational standards"
-                ],
-                "skill_keywords": [
-                    "company", "proprietary", "organizational",
-                    "internal", "procedure", "standard", "policy"
-                ],
-                "score_if_yes": +1,
-                "score_if_no": 0  # Neutral if Claude knows it
-            },
-            "coordination": {
-                "question": "Does it coordinate operations with decision points?",
-                "examples": [
-                    "Multi-stage validation with branching",
-                    "Orchestration with conditional logic",
-                    "Workflow coordination"
-                ],
-                "subagent_keywords": [
-                    "coordinate", "orchestrate", "workflow", "pipeline",
-                    "branching", "conditional", "decision points"
-                ],
-                "score_if_yes": -1,
-                "score_if_no": +1
-            },
-            "isolated_context": {
-                "question": "Does it need isolated context?",
-                "examples": [
-                    "Long debugging session",
-                    "Extensive exploration",
-                    "Separate conversation thread"
-                ],
-                "subagent_keywords": [
-                    "isolated", "separate", "context", "independent",
-                    "debugging", "exploration", "extensive"
-                ],
-                "score_if_yes": -1,
-                "score_if_no": +1
-            },
-            "clutter_chat": {
-                "question": "Would it clutter main chat with intermediate steps?",
-                "examples": [
-                    "Security scan with 50+ findings",
-                    "Comprehensive code analysis",
-                    "Verbose intermediate output"
-                ],
-                "subagent_keywords": [
-                    "verbose", "detailed", "comprehensive", "extensive",
-                    "many", "multiple outputs", "clutter"
-                ],
-                "score_if_yes": -1,
-                "score_if_no": +1
-            }
-        }
+        self.questions = _QUESTIONS
     
     def analyze_from_answers(self, answers: Dict[str, bool]) -> Dict:
         """
@@ -192,24 +365,24 @@ class DecisionHelper:
             
         This is the PRIMARY mode when Claude has extracted clear answers.
         """
-        # Validate input
-        required_keys = list(self.questions.keys())
-        missing = [k for k in required_keys if k not in answers]
+        # Validate input (set difference; order only matters for the message)
+        missing = _REQUIRED_KEYS_SET.difference(answers)
         
         if missing:
             return {
                 "status": "error",
                 "error_type": "InvalidInput",
-                "message": f"Missing required answers: {', '.join(missing)}",
+                "message": f"Missing required answers: {', '.join(k for k in _REQUIRED_KEYS if k in missing)}",
                 "help": "Provide complete answers for all 8 questions",
-                "required_keys": required_keys
+                "required_keys": list(_REQUIRED_KEYS)
             }
         
-        # Validate types
-        invalid_types = []
-        for key, value in answers.items():
-            if not isinstance(value, bool):
-                invalid_types.append(f"{key}={type(value).__name__}")
+        # Validate types (bool cannot be subclassed, so an exact type check suffices)
+        invalid_types = [
+            f"{key}={type(value).__name__}"
+            for key, value in answers.items()
+            if type(value) is not bool
+        ]
         
         if invalid_types:
             return {
@@ -219,12 +392,43 @@ class DecisionHelper:
                 "help": "Use true/false for all answer values"
             }
         
-        # Store answers and calculate scores
+        return self._score_and_build(answers)
+    
+    def _score_and_build(self, answers: Mapping[str, bool]) -> Dict:
+        """
+        Score already-validated answers and build the recommendation.
+        
+        Args:
+            answers: Complete boolean answers for all 8 questions
+            
+        Returns:
+            Success result dict (see _build_recommendation)
+            
+        Shared by analyze_from_answers (after validation) and
+        analyze_from_description, whose inferred answers are complete
+        booleans by construction and need no re-validation.
+        """
         self.answers = answers
         self._calculate_scores()
         
         return self._build_recommendation()
     
+    def analyze_batch(self, answers_list: List[Dict[str, bool]]) -> List[Dict]:
+        """
+        Analyze several pre-answered use cases in one call.
+        
+        Args:
+            answers_list: List of answer dicts, same format as analyze_from_answers
+            
+        Returns:
+            One result dict per input, in input order. Invalid entries
+            produce their usual error dict without stopping the batch.
+            
+        Lets Claude compare candidate designs in one process instead of
+        paying interpreter startup per use case.
+        """
+        return [self.analyze_from_answers(answers) for answers in answers_list]
+    
     def analyze_from_description(self, description: str) -> Dict:
         """
         Infer answers from natural language description.
@@ -249,17 +453,16 @@ class DecisionHelper:
         # Infer answers from keywords
         inference_result = self._infer_answers_from_keywords(description)
         
-        # Analyze with inferred answers
-        result = self.analyze_from_answers(inference_result['answers'])
+        # Analyze with inferred answers (always complete, skip validation)
+        result = self._score_and_build(inference_result['answers'])
         
-        if result['status'] == 'success':
-            # Add inference metadata
-            result['inference_mode'] = True
-            result['inference_note'] = "Answers inferred from keywords. For more accurate results, provide explicit answers."
-            result['detected_keywords'] = inference_result['detected']
-            
-            # Reduce confidence for inference
-            result['confidence'] = round(result['confidence'] * 0.85, 2)
+        # Add inference metadata
+        result['inference_mode'] = True
+        result['inference_note'] = "Answers inferred from keywords. For more accurate results, provide explicit answers."
+        result['detected_keywords'] = inference_result['detected']
+        
+        # Reduce confidence for inference
+        result['confidence'] = round(result['confidence'] * 0.85, 2)
         
         return result
     
@@ -275,11 +478,11 @@ class DecisionHelper:
         criteria = {}
         for q_id, q_data in self.questions.items():
             criteria[q_id] = {
-                "question": q_data["question"],
-                "examples": q_data["examples"],
+                "question": q_data.question,
+                "examples": list(q_data.examples),
                 "scoring": {
-                    "yes": q_data["score_if_yes"],
-                    "no": q_data["score_if_no"]
+                    "yes": q_data.score_if_yes,
+                    "no": q_data.score_if_no
                 }
             }
         
@@ -325,40 +528,34 @@ class DecisionHelper:
             }
         }
     
-    def _calculate_scores(self):
+    def _calculate_scores(self) -> None:
         """
         Calculate score based on answers.
         
         Score range: -8 (Strong Subagent) to +8 (Strong Skill)
-        Uses exact logic from File 03.
+        Uses exact logic from File 03, read from the precomputed
+        _SCORE_TABLE (a bool answer indexes its NO/YES column).
+        """
+        answers = self.answers
+        self.score = sum(
+            row[answers[q_id]] for q_id, row in zip(_REQUIRED_KEYS, _SCORE_TABLE)
+        )
+    
+    @property
+    def reasoning(self) -> List[str]:
         """
-        self.score = 0
-        self.reasoning = []
+        Per-question explanation of the current answers.
         
-        for q_id, q_data in self.questions.items():
-            answer = self.answers[q_id]
-            
-            if answer:
-                # YES answer
-                score_change = q_data["score_if_yes"]
-                direction = "favors Skill" if score_change > 0 else "favors Subagent"
-                self.reasoning.append(
-                    f"{q_data['question']} â†’ YES ({direction})"
-                )
-            else:
-                # NO answer
-                score_change = q_data["score_if_no"]
-                if score_change != 0:
-                    direction = "favors Skill" if score_change > 0 else "favors Subagent"
-                    self.reasoning.append(
-                        f"{q_data['question']} â†’ NO ({direction})"
-                    )
-                else:
-                    self.reasoning.append(
-                        f"{q_data['question']} â†’ NO (neutral)"
-                    )
-            
-            self.score += score_change
+        Built on access rather than during scoring, and picked from the
+        precomputed _REASONS table, so no strings are formatted per call.
+        """
+        if not self.answers:
+            return []
+        
+        answers = self.answers
+        return [
+            reasons[answers[q_id]] for q_id, reasons in zip(_REQUIRED_KEYS, _REASONS)
+        ]
     
     def _build_recommendation(self) -> Dict:
         """
@@ -367,28 +564,16 @@ class DecisionHelper:
         Returns:
             Structured JSON for Claude to parse and explain
         """
-        # Interpret score (exact File 03 logic)
-        if self.score >= 6:
-            recommendation = "Strong Skill"
-            confidence = 0.90 + (self.score - 6) * 0.025  # 90-95%
-        elif self.score >= 3:
-            recommendation = "Moderate Skill"
-            confidence = 0.75 + (self.score - 3) * 0.033  # 75-85%
-        elif self.score >= -1:
-            recommendation = "Hybrid Approach"
-            confidence = 0.60 + (self.score + 1) * 0.033  # 60-70%
-        elif self.score >= -5:
-            recommendation = "Moderate Subagent"
-            confidence = 0.75 + (abs(self.score) - 3) * 0.05  # 75-85%
-        else:
-            recommendation = "Strong Subagent"
-            confidence = 0.90 + (abs(self.score) - 6) * 0.025  # 90-95%
+        # Interpret score (exact File 03 logic, tabulated at import)
+        idx = self.score + 8
+        recommendation = _RECOMMENDATION_BY_SCORE[idx]
+        confidence = _CONFIDENCE_BY_SCORE[idx]
         
         return {
             "status": "success",
             "recommendation": recommendation,
             "score": self.score,
-            "confidence": round(confidence, 2),
+            "confidence": confidence,
             "reasoning": self.reasoning,
             "token_analysis": self._calculate_token_impact(),
             "pattern_suggestions": self._generate_pattern_suggestions(),
@@ -410,29 +595,7 @@ class DecisionHelper:
         Returns:
             Dict with token cost estimates and recommendations
         """
-        # Base estimates from File 05
-        if self.score >= 3:
-            # Skill-leaning recommendation
-            skill_cost = 500  # Typical skill invocation
-            subagent_cost = skill_cost * 15
-            note = "Skill approach significantly more token-efficient"
-        elif self.score <= -3:
-            # Subagent-leaning recommendation
-            subagent_cost = 7500  # Complex workflow
-            skill_cost = subagent_cost // 15
-            note = "High token cost justified for complex workflows"
-        else:
-            # Hybrid zone
-            skill_cost = 500
-            subagent_cost = 7500
-            note = "Consider hybrid: balance efficiency and capability"
-        
-        return {
-            "skill_approach_tokens": skill_cost,
-            "subagent_approach_tokens": subagent_cost,
-            "cost_multiplier": round(subagent_cost / skill_cost, 1),
-            "recommendation_note": note
-        }
+        return dict(_TOKEN_IMPACT_BY_SCORE[self.score + 8])
     
     def _generate_pattern_suggestions(self) -> List[str]:
         """
@@ -488,38 +651,15 @@ class DecisionHelper:
         Returns:
             Dict with inferred answers and detected keywords
         """
-        text_lower = text.lower()
         detected = {}
         inferred_answers = {}
         
-        for q_id, q_data in self.questions.items():
-            # Check for skill-favoring keywords
-            skill_keywords = q_data.get("skill_keywords", [])
-            skill_matches = [k for k in skill_keywords if k in text_lower]
-            
-            # Check for subagent-favoring keywords
-            subagent_keywords = q_data.get("subagent_keywords", [])
-            subagent_matches = [k for k in subagent_keywords if k in text_lower]
-            
+        for q_id, answer, skill_matches, subagent_matches in _infer_cached(text.strip().lower()):
             detected[q_id] = {
-                "skill_keywords": skill_matches,
-                "subagent_keywords": subagent_matches
+                "skill_keywords": list(skill_matches),
+                "subagent_keywords": list(subagent_matches)
             }
-            
-            # Infer answer based on keyword presence
-            if skill_matches and not subagent_matches:
-                inferred_answers[q_id] = True
-            elif subagent_matches and not skill_matches:
-                inferred_answers[q_id] = False
-            elif len(skill_matches) > len(subagent_matches):
-                inferred_answers[q_id] = True
-            elif len(subagent_matches) > len(skill_matches):
-                inferred_answers[q_id] = False
-            else:
-                # Default based on question type
-                # Questions that favor Skills by default: utility, reusable, missing_knowledge
-                default_yes = q_id in ["utility_task", "reusable", "missing_knowledge"]
-                inferred_answers[q_id] = default_yes
+            inferred_answers[q_id] = answer
         
         return {
             "answers": inferred_answers,
@@ -527,8 +667,72 @@ class DecisionHelper:
         }
 
 
-def main():
-    """CLI entry point for agent-layer usage."""
+@lru_cache(maxsize=None)
+def _criteria_json_bytes() -> bytes:
+    """
+    Serialize the static --show-criteria payload once per process.
+
+    The criteria never depend on input, so the JSON is encoded on first use
+    and the same bytes are written for every later request.
+    """
+    return dumps_json_bytes(DecisionHelper().show_criteria()) + b"\n"
+
+
+# Flags understood by the argparse-free fast path (flag -> attribute name)
+_VALUE_FLAGS: Final[Mapping[str, str]] = MappingProxyType({
+    '--answers': 'answers',
+    '--analyze': 'analyze',
+    '--format': 'format',
+})
+_BOOL_FLAGS: Final[Mapping[str, str]] = MappingProxyType({
+    '--show-criteria': 'show_criteria',
+    '--serve': 'serve',
+})
+_MODE_FLAGS: Final[frozenset] = frozenset({'--answers', '--analyze', '--show-criteria', '--serve'})
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse common agent invocations without building an argparse parser.
+    
+    Handles exactly one mode flag plus an optional --format, in either
+    "--flag value" or "--flag=value" form. Anything else (--help, unknown
+    or abbreviated flags, repeated flags, values starting with "-") returns
+    None so argparse parses it and reports errors exactly as before.
+    """
+    args = SimpleNamespace(
+        answers=None, analyze=None, show_criteria=False, serve=False, format='json'
+    )
+    seen: Set[str] = set()
+    i = 0
+    while i < len(argv):
+        flag, eq, value = argv[i].partition('=')
+        if flag in seen:
+            return None
+        seen.add(flag)
+        
+        if flag in _BOOL_FLAGS and not eq:
+            setattr(args, _BOOL_FLAGS[flag], True)
+        elif flag in _VALUE_FLAGS:
+            if not eq:
+                i += 1
+                if i == len(argv) or argv[i].startswith('-'):
+                    return None
+                value = argv[i]
+            setattr(args, _VALUE_FLAGS[flag], value)
+        else:
+            return None
+        i += 1
+    
+    if len(seen & _MODE_FLAGS) != 1 or args.format not in ('text', 'json'):
+        return None
+    return args
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser (help text, usage errors)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Decision helper for Skills vs Subagents (Agent-Layer Tool)",
         epilog="References: Files 02 (comparison), 03 (decision tree), 05 (token economics)",
@@ -557,21 +761,160 @@ def main():
         action='store_true',
         help='Show decision criteria (Mode 3 - Reference)'
     )
+    
+    mode_group.add_argument(
+        '--serve',
+        action='store_true',
+        help='Read one JSON request per stdin line and answer each with one '
+             'JSON line, keeping the process warm (Mode 4 - Batch)'
+    )
 
     # Add --format argument (JSON is default for agent-layer tool)
     add_format_argument(parser, default='json')
 
-    args = parser.parse_args()
+    return parser
+
+
+def handle_request(helper: DecisionHelper, request: Dict) -> Dict:
+    """
+    Dispatch one --serve request to the matching mode.
     
+    Args:
+        helper: Shared DecisionHelper instance
+        request: {"answers": {...}}, {"analyze": "..."} or
+            {"show_criteria": true}; an optional "id" is echoed back
+            
+    Returns:
+        Result dict, same shape as the one-shot CLI modes
+    """
+    if not isinstance(request, dict):
+        return {
+            "status": "error",
+            "error_type": "InvalidInput",
+            "message": f"Request must be a JSON object, got {type(request).__name__}",
+            "help": 'Send {"answers": {...}}, {"analyze": "..."} or {"show_criteria": true}'
+        }
+    
+    if "answers" in request:
+        result = helper.analyze_from_answers(request["answers"])
+    elif "analyze" in request:
+        result = helper.analyze_from_description(request["analyze"])
+    elif request.get("show_criteria"):
+        result = helper.show_criteria()
+    else:
+        result = {
+            "status": "error",
+            "error_type": "InvalidInput",
+            "message": "Request has no answers, analyze or show_criteria field",
+            "help": 'Send {"answers": {...}}, {"analyze": "..."} or {"show_criteria": true}'
+        }
+    
+    if "id" in request:
+        result["id"] = request["id"]
+    return result
+
+
+def serve(
+    stdin: Optional[BinaryIO] = None, stdout: Optional[BinaryIO] = None
+) -> int:
+    """
+    Answer newline-delimited JSON requests until EOF (Mode 4).
+    
+    Keeps one interpreter, the compiled keyword scanner and the
+    inference cache warm across requests, so a caller issuing many
+    decisions pays Python startup once. Each response is written as a
+    single JSON line and flushed immediately. Blank lines are skipped;
+    malformed lines get an error response and the loop continues.
+    
+    Args:
+        stdin: Binary input stream (default: sys.stdin.buffer)
+        stdout: Binary output stream (default: sys.stdout.buffer)
+        
+    Returns:
+        Exit code (0 at EOF)
+    """
+    stdin = stdin if stdin is not None else sys.stdin.buffer
+    stdout = stdout if stdout is not None else sys.stdout.buffer
     helper = DecisionHelper()
-    result = None
+    
+    for line in stdin:
+        if not line.strip():
+            continue
+        
+        request: Any = None
+        try:
+            request = json.loads(line)
+            result = handle_request(helper, request)
+        except json.JSONDecodeError as e:
+            result = {
+                "status": "error",
+                "error_type": "InvalidJSON",
+                "message": f"Invalid JSON request: {str(e)}",
+                "help": "Send one JSON object per line"
+            }
+        except Exception as e:
+            result = {
+                "status": "error",
+                "error_type": "UnexpectedError",
+                "message": str(e),
+                "help": "Contact support if this persists"
+            }
+        
+        # Echo the id on errors too, whenever the request parsed far enough
+        has_id = isinstance(request, dict) and "id" in request
+        if has_id:
+            result["id"] = request["id"]
+        
+        # Encoding is guarded as well: one unencodable response must not
+        # end the worker and leave the rest of stdin unanswered. The id
+        # came from json.loads, so it always re-encodes.
+        try:
+            payload = dumps_json_bytes(result, indent=False)
+        except Exception as e:
+            error = {
+                "status": "error",
+                "error_type": "UnexpectedError",
+                "message": f"Response could not be encoded: {str(e)}",
+                "help": "Contact support if this persists"
+            }
+            if has_id:
+                error["id"] = request["id"]
+            payload = dumps_json_bytes(error, indent=False)
+        
+        stdout.write(payload)
+        stdout.write(b"\n")
+        stdout.flush()
+    
+    return 0
+
+
+def main() -> int:
+    """CLI entry point for agent-layer usage."""
+    # Hot path skips argparse; it is only built for help and usage errors
+    fast_args = _parse_args_fast(sys.argv[1:])
+    args: Union[SimpleNamespace, "argparse.Namespace"] = (
+        fast_args if fast_args is not None else _build_parser().parse_args()
+    )
+    
+    if args.serve:
+        # Mode 4: always newline-delimited JSON, --format is ignored
+        return serve()
+    
+    if args.show_criteria and args.format == 'json':
+        # Mode 3 is static: write the pre-serialized payload directly
+        sys.stdout.buffer.write(_criteria_json_bytes())
+        return 0
+    
+    helper = DecisionHelper()
+    result: Dict
     
     try:
-        if args.answers:
+        if args.answers is not None:
             # Mode 1: Pre-answered questions
-            answers_path = Path(args.answers)
-            
-            if not answers_path.exists():
+            try:
+                # One read, one C-level parse (no separate exists() stat)
+                raw = Path(args.answers).read_bytes()
+            except FileNotFoundError:
                 result = {
                     "status": "error",
                     "error_type": "FileNotFound",
@@ -579,15 +922,14 @@ def main():
                     "help": "Check file path or use --analyze mode"
                 }
             else:
-                with open(answers_path, 'r') as f:
-                    answers = json.load(f)
+                answers = json.loads(raw)
                 result = helper.analyze_from_answers(answers)
         
-        elif args.analyze:
+        elif args.analyze is not None:
             # Mode 2: Keyword-based inference
             result = helper.analyze_from_description(args.analyze)
         
-        elif args.show_criteria:
+        else:
             # Mode 3: Show criteria
             result = helper.show_criteria()
     
@@ -610,16 +952,16 @@ def main():
     # Output based on format
     if args.format == 'json':
         # JSON output (default for agent-layer)
-        print(json.dumps(result, indent=2))
+        write_json(result)
     else:
         # Text output (for debugging/human reading)
         print_text_format(result)
 
     # Exit code based on status
-    return 0 if result and result.get('status') == 'success' else 1
+    return 0 if result.get('status') == 'success' else 1
 
 
-def print_text_format(result: Dict):
+def print_text_format(result: Dict) -> None:
     """Format result as human-readable text."""
     if result.get('status') == 'error':
         print(f"\n❌ Error: {result.get('error_type')}")
@@ -8,23 +8,73 @@ v1.2 Update: Enhanced validation before packaging
 - Validates cross-references before packing
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--strict]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--strict | --skip-validation] [--verbose]
+        [--compression {store,fast,default,best,zstd}] [--force]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
     python utils/package_skill.py skills/public/my-skill ./dist --strict
+
+Library use:
+    package_skill(skill_path, output_dir=None, strict=False, ...) is the stable
+    API for batch scripts and wrappers; it returns the archive Path or None.
+    Importing this module is cheap: argparse, zipfile and the validators are
+    only loaded when main() or package_skill() actually runs.
 """
 
+import os
 import sys
-import zipfile
+from functools import lru_cache
 from pathlib import Path
-from quick_validate import validate_skill
 
-try:
-    from utils.reference_validator import SkillPackageValidator
-except ImportError:
-    SkillPackageValidator = None  # Graceful fallback
+# zipfile, the deflate backend, the thread pool and the validators are
+# imported where they are used, so --help and early error exits don't
+# load compression codecs or YAML.
+
+
+# --compression choices: name -> (zipfile method name, compresslevel).
+# Skills are mostly small text files, where higher deflate levels cost
+# far more CPU than they save in size, so 'fast' is the default.
+# ZIP_ZSTANDARD only exists on Python 3.14+; elsewhere package_skill
+# falls back to 'fast'.
+COMPRESSION_LEVELS = {
+    'store': ('ZIP_STORED', None),
+    'fast': ('ZIP_DEFLATED', 1),
+    'default': ('ZIP_DEFLATED', 6),
+    'best': ('ZIP_DEFLATED', 9),
+    'zstd': ('ZIP_ZSTANDARD', 3),
+}
+
+# Deflated files at least this big are compressed in worker threads;
+# below it the thread hand-off costs more than the compression.
+POOL_MIN_SIZE = 4096
+
+# Files written through zipfile itself (small deflated files, store,
+# zstd) below COPY_MIN_SIZE are read in one call; larger ones are streamed
+# with a COPY_BUFFER_SIZE buffer instead of ZipFile.write()'s 8 KiB one,
+# cutting read()/write() calls on large assets.
+COPY_MIN_SIZE = 64 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Files of at least MMAP_MIN_SIZE are memory-mapped and compressed or
+# written straight from the mapping, skipping the copy into a bytes buffer
+MMAP_MIN_SIZE = 1024 * 1024
+
+
+# Files or directories whose presence marks a project directory
+PROJECT_MARKERS = frozenset({
+    '.git',
+    'package.json',
+    'pyproject.toml',
+    'setup.py',
+    'Cargo.toml',
+    'go.mod',
+    'pom.xml',
+    'build.gradle',
+    'composer.json',  # PHP
+    'Gemfile',        # Ruby
+})
 
 
 def is_project_directory(path):
@@ -45,30 +95,502 @@ def is_project_directory(path):
     Returns:
         bool: True if directory appears to be a project directory
     """
-    if not path.is_dir():
+    return _is_project_directory(str(path))
+
+
+@lru_cache(maxsize=128)
+def _is_project_directory(path):
+    """
+    One readdir of path intersected with PROJECT_MARKERS, instead of a
+    stat() per marker. Cached because batch packaging of sibling skills
+    asks about the same parent directory repeatedly.
+    """
+    try:
+        with os.scandir(path) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        # Missing, not a directory, or unreadable
         return False
 
-    project_markers = [
-        '.git',
-        'package.json',
-        'pyproject.toml',
-        'setup.py',
-        'Cargo.toml',
-        'go.mod',
-        'pom.xml',
-        'build.gradle',
-        'composer.json',  # PHP
-        'Gemfile',        # Ruby
-    ]
+    return not PROJECT_MARKERS.isdisjoint(names)
+
+
+def _scandir_files(root, dirs=None):
+    """
+    Recursively yield every file under a directory, using os.scandir.
+
+    Matches the previous rglob + is_file() walk: symlinked files are
+    included, symlinked directories are not descended into, and
+    unreadable or vanished subdirectories are skipped. DirEntry caches
+    the dirent type, so directories cost no extra stat() per entry.
+
+    Args:
+        root: Directory to walk (str or Path)
+        dirs: Optional list; every subdirectory walked into is appended
+
+    Yields:
+        (path, rel) tuples of str: the full path and the path relative
+        to root, computed by slicing rather than Path.relative_to
+    """
+    root_str = str(root)
+    prefix_len = len(root_str + os.sep)
+    stack = [root_str]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        if dirs is not None:
+                            dirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path, entry.path[prefix_len:]
+        except (FileNotFoundError, PermissionError):
+            continue
+
+
+def _newest_mtime(root, files, dirs):
+    """
+    Newest st_mtime in a skill tree, from a _scandir_files() walk.
+
+    Directory mtimes are included because adding, removing or renaming
+    a file changes its directory but no file's own mtime.
+
+    Args:
+        root: The walked directory
+        files: (path, rel_path) pairs the walk yielded
+        dirs: Subdirectories the walk collected
+    """
+    newest = os.stat(root).st_mtime
+    for path in dirs:
+        newest = max(newest, os.stat(path).st_mtime)
+    for path, _ in files:
+        newest = max(newest, os.stat(path).st_mtime)
+    return newest
+
+
+def _run_options(compression, strict, skip_validation):
+    """
+    The options an archive was built with, as recorded in its manifest.
+
+    Compression is the requested --compression choice; validation is
+    'strict', 'default' or 'skipped'.
+    """
+    if skip_validation:
+        validation = 'skipped'
+    else:
+        validation = 'strict' if strict else 'default'
+    return {'compression': compression, 'validation': validation}
+
+
+def _archive_is_current(skill_path, skill_filename, options, files, dirs):
+    """
+    True if skill_filename was built with the same run options and is
+    newer than every entry in skill_path (walked into files and dirs).
+
+    The options come from the archive's manifest, so e.g. a --strict run
+    never skips over an archive that only passed default validation.
+    """
+    import json
+
+    try:
+        archive = os.stat(skill_filename)
+        with open(_manifest_path(skill_filename), 'rb') as f:
+            manifest = json.load(f)
+        if (manifest.get('options') != options
+                or manifest.get('archive_size') != archive.st_size):
+            return False
+        # A file removed since the walk fails its stat: repackage
+        return _newest_mtime(skill_path, files, dirs) < archive.st_mtime
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+@lru_cache(maxsize=None)
+def _deflate_backend(level):
+    """
+    Pick the fastest zlib-compatible module for the thread-pool path.
+
+    Optional accelerators are used when installed: isal (ISA-L,
+    pip install isal), then zlib-ng (pip install zlib-ng), else the
+    stdlib zlib. All three emit standard deflate streams, so any unzip
+    reads the result; only speed and exact sizes differ. ISA-L's best
+    level compresses noticeably worse than zlib's 9, so 'best' skips it.
+
+    Args:
+        level: zlib compression level (0-9)
+
+    Returns:
+        (module, level in the module's own scale)
+    """
+    if level < 9:
+        try:
+            from isal import isal_zlib
+            # ISA-L has levels 0-3: fast (1) -> 1, default (6) -> 2
+            return isal_zlib, min(3, (level + 2) // 3)
+        except ImportError:
+            pass
 
-    for marker in project_markers:
-        if (path / marker).exists():
-            return True
+    try:
+        from zlib_ng import zlib_ng
+        return zlib_ng, level
+    except ImportError:
+        pass
 
-    return False
+    import zlib
+    return zlib, level
 
 
-def package_skill(skill_path, output_dir=None, strict=False):
+def _deflate_file(path, level):
+    """
+    Read a file and deflate it as a raw stream (wbits=-15), like zipfile.
+
+    Runs in worker threads: the deflate backend releases the GIL while
+    compressing.
+
+    Returns:
+        (file_size, crc32, compressed bytes)
+    """
+    import mmap
+
+    zlib_mod, backend_level = _deflate_backend(6 if level is None else level)
+
+    def deflate(data):
+        compressor = zlib_mod.compressobj(backend_level, zlib_mod.DEFLATED, -15)
+        return len(data), zlib_mod.crc32(data), compressor.compress(data) + compressor.flush()
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return deflate(data)
+        return deflate(f.read())
+
+
+def _write_compressed(zipf, zinfo, compress_type, file_size, crc, payload):
+    """
+    Append an already-compressed entry to an open ZipFile.
+
+    zipfile has no public API for pre-compressed data, so this follows
+    ZipFile.mkdir(): the sizes and CRC are known up front, so the local
+    header is written once, followed by the payload.
+    """
+    import zipfile
+
+    zinfo.compress_type = compress_type
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(payload)
+    zinfo.CRC = crc
+    zip64 = max(file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+    with zipf._lock:
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(payload)
+        zipf.start_dir = zipf.fp.tell()
+
+
+def _read_compressed(zipf, info):
+    """Read an entry's raw, still-compressed payload from a read-mode ZipFile."""
+    import struct
+    import zipfile
+
+    fp = zipf.fp
+    fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+    if header[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    fp.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], 1)
+    return fp.read(info.compress_size)
+
+
+def _zipinfo_from_stat(arcname, st):
+    """
+    Build a ZipInfo from an existing os.stat() result.
+
+    Equivalent to ZipInfo.from_file(path, arcname, strict_timestamps=False)
+    for a regular file, without stat()ing it again. arcname must already
+    be a clean '/'-separated relative name.
+    """
+    import time
+    import zipfile
+
+    date_time = time.localtime(st.st_mtime)[:6]
+    # ZIP timestamps cover 1980-2107; clamp like strict_timestamps=False
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16  # Unix attributes
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _copy_file(zipf, file_path, zinfo):
+    """
+    Write a file into an open ZipFile: one read below COPY_MIN_SIZE, a
+    COPY_BUFFER_SIZE streaming copy above it, or a single write from a
+    memory map at MMAP_MIN_SIZE or more.
+
+    Same as ZipFile.write() apart from how the data is read, so the
+    entry uses the archive's compression method and level.
+    """
+    import mmap
+    import shutil
+
+    zinfo.compress_type = zipf.compression
+    zinfo._compresslevel = zipf.compresslevel
+    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+        if zinfo.file_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                dst.write(data)
+        elif zinfo.file_size >= COPY_MIN_SIZE:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        else:
+            dst.write(src.read())
+
+
+def _add_files(zipf, files, method, level, previous=None):
+    """
+    Write (path, rel_path) pairs into an open ZipFile.
+
+    Files whose (mtime, size) match the previous manifest are copied
+    from the previous archive still compressed. Otherwise, with deflate,
+    files of POOL_MIN_SIZE or more are compressed in a thread pool while
+    the main thread keeps writing; only the archive writes are serial.
+    With the pool, entry data is written largest first (ties by name),
+    in submission order, so the layout is deterministic; the central
+    directory keeps walk order. At most a few results per worker are held in memory
+    at once.
+
+    Args:
+        zipf: ZipFile open for writing
+        files: Iterable of (path, rel_path)
+        method: zipfile compression method of zipf
+        level: compresslevel of zipf
+        previous: Optional (ZipFile, manifest files) from _open_previous()
+
+    Returns:
+        (arcnames in write order, {arcname: [mtime_ns, size]} for the
+        new manifest, number of entries reused from the previous archive)
+    """
+    import zipfile
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    # ZIP names always use '/'; relative paths are already plain strings,
+    # so no Path objects are built per entry
+    if os.sep != '/':
+        files = ((path, rel.replace(os.sep, '/')) for path, rel in files)
+
+    if previous is not None:
+        prev_zipf, prev_files = previous
+        prev_infos = {info.filename: info for info in prev_zipf.infolist()}
+    else:
+        prev_zipf, prev_files, prev_infos = None, {}, {}
+
+    workers = os.cpu_count() or 1
+    added = []
+    manifest = {}
+    reused = 0
+    pending = deque()
+
+    def drain(limit):
+        while len(pending) > limit:
+            zinfo, future = pending.popleft()
+            _write_compressed(zipf, zinfo, zipfile.ZIP_DEFLATED, *future.result())
+            added.append(zinfo.filename)
+
+    pool = ThreadPoolExecutor(max_workers=workers) if method == zipfile.ZIP_DEFLATED else None
+
+    # Stat everything up front (the manifest needs it anyway). With a pool,
+    # submit the largest files first: a big file left for the end of the
+    # walk would otherwise keep one worker busy while the rest sit idle.
+    entries = [(file_path, arcname, os.stat(file_path)) for file_path, arcname in files]
+    walk_order = {arcname: i for i, (_, arcname, _) in enumerate(entries)}
+    if pool is not None:
+        entries.sort(key=lambda entry: (-entry[2].st_size, entry[1]))
+
+    try:
+        for file_path, arcname, st in entries:
+            key = [st.st_mtime_ns, st.st_size]
+            manifest[arcname] = key
+            # One stat per file: the ZipInfo reuses it instead of
+            # ZipFile.write() calling os.stat() again
+            zinfo = _zipinfo_from_stat(arcname, st)
+
+            old = prev_infos.get(arcname)
+            if (old is not None and prev_files.get(arcname) == key
+                    and old.file_size == st.st_size and not old.flag_bits & 0x1):
+                # Unchanged since the last packaging: skip compression
+                _write_compressed(zipf, zinfo, old.compress_type, old.file_size, old.CRC,
+                                  _read_compressed(prev_zipf, old))
+                added.append(arcname)
+                reused += 1
+            elif pool is not None and zinfo.file_size >= POOL_MIN_SIZE:
+                pending.append((zinfo, pool.submit(_deflate_file, file_path, level)))
+                drain(workers * 4)
+            else:
+                _copy_file(zipf, file_path, zinfo)
+                added.append(arcname)
+        drain(0)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Only the data is size-ordered: list entries in the central directory
+    # (what unzip -l shows) and in the report in walk order
+    zipf.filelist.sort(key=lambda info: walk_order[info.filename])
+    added.sort(key=walk_order.__getitem__)
+    return added, manifest, reused
+
+
+def _resolve_compression(compression):
+    """
+    Map a --compression choice to what this Python can write.
+
+    Returns:
+        (effective choice, zipfile method, compresslevel); the effective
+        choice is 'fast' when the requested method is unavailable
+    """
+    import zipfile
+
+    method_name, level = COMPRESSION_LEVELS[compression]
+    method = getattr(zipfile, method_name, None)
+    if method is None:
+        compression = 'fast'
+        method_name, level = COMPRESSION_LEVELS[compression]
+        method = getattr(zipfile, method_name)
+    return compression, method, level
+
+
+def _manifest_path(skill_filename):
+    """Sidecar manifest next to the archive: <name>.skill.manifest"""
+    return skill_filename.with_name(skill_filename.name + '.manifest')
+
+
+def _open_previous(skill_filename, compression):
+    """
+    Open the existing archive for entry reuse, if its manifest matches.
+
+    The manifest must have been written for this archive (same size)
+    with the same effective compression; otherwise nothing is reused.
+
+    Returns:
+        (ZipFile open for reading, {arcname: [mtime_ns, size]}), or None
+    """
+    import json
+    import zipfile
+
+    try:
+        with open(_manifest_path(skill_filename), 'rb') as f:
+            manifest = json.load(f)
+        if (manifest['compression'] != compression
+                or manifest['archive_size'] != os.path.getsize(skill_filename)):
+            return None
+        return zipfile.ZipFile(skill_filename), manifest['files']
+    except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+        return None
+
+
+def _write_manifest(skill_filename, compression, files, options):
+    """Record what the archive was built from; a failed write only disables reuse."""
+    import json
+
+    manifest = {
+        'compression': compression,
+        'options': options,
+        'archive_size': os.path.getsize(skill_filename),
+        'files': files,
+    }
+    try:
+        with open(_manifest_path(skill_filename), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+    except OSError:
+        pass
+
+
+def _write_archive(filename, files, method, level, previous=None):
+    """
+    Write a skill's files into a new zip archive.
+
+    Args:
+        filename: Archive path to create
+        files: (path, rel_path) pairs from _scandir_files(skill_path); paths
+            are relative to the skill folder (not its parent) to avoid a
+            wrapper folder
+        method: zipfile compression method
+        level: compresslevel for that method
+        previous: Optional (ZipFile, manifest files) to reuse entries from
+
+    Returns:
+        Same as _add_files
+    """
+    import zipfile
+
+    with zipfile.ZipFile(filename, 'w', compression=method, compresslevel=level,
+                         strict_timestamps=False) as zipf:
+        return _add_files(zipf, files, method, level, previous)
+
+
+def _report_references(ref_future, strict):
+    """
+    Wait for the reference validation and print its report.
+
+    Args:
+        ref_future: Future of validate_for_packaging(), or None if the
+            validator is unavailable
+        strict: Whether reference issues abort packaging
+
+    Returns:
+        False if strict mode should abort packaging, True otherwise
+    """
+    if ref_future is None:
+        # Fallback if validator not available
+        print(f"⚠️ Reference validation skipped (utility unavailable)\n")
+        return True
+
+    try:
+        ref_result = ref_future.result()
+    except Exception:
+        # Graceful fallback
+        print(f"⚠️ Reference validation skipped (utility unavailable)\n")
+        return True
+
+    if ref_result.status == 'fail':
+        if strict:
+            print(f"❌ Reference validation failed: {ref_result.message}")
+            print(f"   {ref_result.suggestion}")
+            return False
+        print(f"⚠️ Warning: {ref_result.message}")
+        if ref_result.missing_files:
+            print(f"   Missing files: {', '.join(ref_result.missing_files[:3])}")
+        if ref_result.orphaned_files:
+            print(f"   Orphaned files: {', '.join(ref_result.orphaned_files[:3])}")
+        print(f"   Tip: Use --strict to fail on reference issues\n")
+    else:
+        print(f"✅ References validated: {len(ref_result.valid_references)} files\n")
+    return True
+
+
+def _remove_file(path):
+    """Delete a file if it exists (partial or discarded archives)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def package_skill(skill_path, output_dir=None, strict=False, verbose=False,
+                  compression='fast', force=False, skip_validation=False):
     """
     Package a skill folder into a .skill file.
 
@@ -78,12 +600,22 @@ def package_skill(skill_path, output_dir=None, strict=False):
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
         strict: If True, fail on any reference issues. If False, warn only.
+        verbose: If True, list every archived file. If False, print a count only.
+        compression: Key of COMPRESSION_LEVELS (store, fast, default, best, zstd)
+        force: If True, repackage even when the existing archive is up to date,
+            and recompress every file instead of reusing unchanged entries
+        skip_validation: If True, skip skill and reference validation (e.g. when
+            an earlier CI step already validated). Cannot be combined with strict.
 
     Returns:
-        Path to the created .skill file, or None if error
+        Path to the created (or already up-to-date) .skill file, or None if error
     """
     skill_path = Path(skill_path).resolve()
 
+    if strict and skip_validation:
+        print("❌ Error: strict mode needs validation; drop --strict or --skip-validation")
+        return None
+
     # Validate skill folder exists
     if not skill_path.exists():
         print(f"❌ Error: Skill folder not found: {skill_path}")
@@ -99,43 +631,6 @@ def package_skill(skill_path, output_dir=None, strict=False):
         print(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
-    # Run validation before packaging
-    print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
-    if not valid:
-        print(f"❌ Validation failed: {message}")
-        print("   Please fix the validation errors before packaging.")
-        return None
-    print(f"✅ {message}\n")
-
-    # v1.2: Enhanced reference validation before packaging
-    print("🔗 Checking file references and orphaned files...")
-    if SkillPackageValidator:
-        try:
-            pkg_validator = SkillPackageValidator(str(skill_path))
-            ref_result = pkg_validator.validate_for_packaging(strict=strict)
-
-            if ref_result.status == 'fail':
-                if strict:
-                    print(f"❌ Reference validation failed: {ref_result.message}")
-                    print(f"   {ref_result.suggestion}")
-                    return None
-                else:
-                    print(f"⚠️ Warning: {ref_result.message}")
-                    if ref_result.missing_files:
-                        print(f"   Missing files: {', '.join(ref_result.missing_files[:3])}")
-                    if ref_result.orphaned_files:
-                        print(f"   Orphaned files: {', '.join(ref_result.orphaned_files[:3])}")
-                    print(f"   Tip: Use --strict to fail on reference issues\n")
-            else:
-                print(f"✅ References validated: {len(ref_result.valid_references)} files\n")
-        except Exception as e:
-            # Graceful fallback
-            print(f"⚠️ Reference validation skipped (utility unavailable)\n")
-    else:
-        # Fallback if validator not available
-        print(f"⚠️ Reference validation skipped (utility unavailable)\n")
-
     # Determine output location (hybrid approach)
     skill_name = skill_path.name
     if output_dir:
@@ -155,29 +650,106 @@ def package_skill(skill_path, output_dir=None, strict=False):
             print(f"📁 Output directory (current working directory): {output_path}")
 
     skill_filename = output_path / f"{skill_name}.skill"
+    print()
 
-    # Create the .skill file (zip format)
-    try:
-        print(f"\n📦 Creating archive: {skill_filename.name}")
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    # Use skill_path (not skill_path.parent) to avoid wrapper folder
-                    arcname = file_path.relative_to(skill_path)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
-        print(f"\n✅ Successfully packaged skill to: {skill_filename}")
+    # The skill tree is walked once; the up-to-date check, the reference
+    # validator and the archive writer all share this file list
+    dirs = []
+    files = list(_scandir_files(skill_path, dirs))
+
+    # Nothing to do if the archive was built with the same options and is
+    # newer than everything in the skill
+    options = _run_options(compression, strict, skip_validation)
+    if not force and _archive_is_current(skill_path, skill_filename, options, files, dirs):
+        print(f"✅ Archive up-to-date, skipping: {skill_filename}")
+        print("   Use --force to repackage")
         return skill_filename
 
-    except Exception as e:
-        print(f"❌ Error creating .skill file: {e}")
+    if skip_validation:
+        print("⏭️ Validation skipped (--skip-validation)\n")
+    else:
+        # Run validation before packaging
+        from quick_validate import validate_skill
+
+        print("🔍 Validating skill...")
+        valid, message = validate_skill(skill_path)
+        if not valid:
+            print(f"❌ Validation failed: {message}")
+            print("   Please fix the validation errors before packaging.")
+            return None
+        print(f"✅ {message}\n")
+
+    # v1.2: Enhanced reference validation before packaging. It runs in a
+    # worker thread while the archive is written to a temporary file next
+    # to the target; the report is printed once both are done, and a
+    # strict failure discards the temporary archive.
+    from concurrent.futures import ThreadPoolExecutor
+
+    SkillPackageValidator = None
+    if not skip_validation:
+        print("🔗 Checking file references and orphaned files...")
+        try:
+            from utils.reference_validator import SkillPackageValidator
+        except ImportError:
+            SkillPackageValidator = None  # Graceful fallback
+
+    effective, method, level = _resolve_compression(compression)
+    # Entries unchanged since the last packaging are copied, not recompressed
+    previous = None if force else _open_previous(skill_filename, effective)
+    tmp_filename = skill_filename.with_name(skill_filename.name + '.tmp')
+    archive_error = None
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        ref_future = None
+        if SkillPackageValidator:
+            try:
+                pkg_validator = SkillPackageValidator(str(skill_path))
+                ref_future = pool.submit(pkg_validator.validate_for_packaging,
+                                         strict=strict, files=files)
+            except Exception:
+                ref_future = None
+
+        try:
+            added, manifest_files, reused = _write_archive(
+                tmp_filename, files, method, level, previous
+            )
+        except Exception as e:
+            archive_error = e
+        finally:
+            if previous is not None:
+                previous[0].close()
+
+        refs_ok = skip_validation or _report_references(ref_future, strict)
+
+    if not refs_ok:
+        _remove_file(tmp_filename)
+        return None
+
+    print(f"📦 Creating archive: {skill_filename.name}")
+    if archive_error is not None:
+        _remove_file(tmp_filename)
+        print(f"❌ Error creating .skill file: {archive_error}")
         return None
 
+    if effective != compression:
+        print(f"⚠️ Warning: {compression} compression needs Python 3.14+, using fast deflate")
+    os.replace(tmp_filename, skill_filename)
+    _write_manifest(skill_filename, effective, manifest_files, options)
+
+    # One write for the whole listing instead of a print per file
+    if verbose:
+        sys.stdout.write("".join(f"  Added: {arcname}\n" for arcname in added))
+    else:
+        print(f"  Added {len(added)} files")
+    if reused:
+        print(f"  Reused {reused} unchanged files from the previous archive")
+
+    print(f"\n✅ Successfully packaged skill to: {skill_filename}")
+    return skill_filename
+
 
-def main():
+def _build_parser():
+    """Build the CLI parser (only needed when run as a script)."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -187,25 +759,46 @@ def main():
     parser.add_argument('skill_path', help='Path to the skill folder')
     parser.add_argument('output_dir', nargs='?', default=None,
                         help='Output directory for the .skill file (default: current directory)')
-    parser.add_argument('--strict', action='store_true',
-                        help='Fail if any reference issues found (default: warn only)')
-
-    args = parser.parse_args()
+    validation_group = parser.add_mutually_exclusive_group()
+    validation_group.add_argument('--strict', action='store_true',
+                                  help='Fail if any reference issues found (default: warn only)')
+    validation_group.add_argument('--skip-validation', action='store_true',
+                                  help='Skip skill and reference validation, e.g. when an '
+                                       'earlier CI step already ran it')
+    parser.add_argument('--verbose', action='store_true',
+                        help='List every file added to the archive (default: count only)')
+    parser.add_argument('--compression', choices=COMPRESSION_LEVELS, default='fast',
+                        help='store = no compression, fast = deflate level 1 (default), '
+                             'default = deflate level 6, best = deflate level 9, '
+                             'zstd = Zstandard level 3 (faster and smaller than deflate, '
+                             'but needs Python 3.14+ and a zstd-aware unzip; '
+                             'falls back to fast otherwise)')
+    parser.add_argument('--force', action='store_true',
+                        help='Repackage even if the existing .skill archive is newer '
+                             'than every file in the skill folder, and recompress '
+                             'every file instead of reusing unchanged entries')
+
+    return parser
+
+
+def main(argv=None):
+    """CLI entry point: parse arguments and delegate to package_skill()."""
+    args = _build_parser().parse_args(argv)
 
     print(f"📦 Packaging skill: {args.skill_path}")
     if args.output_dir:
         print(f"   Output directory: {args.output_dir}")
     if args.strict:
         print(f"   Mode: STRICT (fail on reference issues)")
+    if args.skip_validation:
+        print(f"   Mode: FAST (validation skipped)")
     print()
 
-    result = package_skill(args.skill_path, args.output_dir, strict=args.strict)
-
-    if result:
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    result = package_skill(args.skill_path, args.output_dir, strict=args.strict,
+                           verbose=args.verbose, compression=args.compression,
+                           force=args.force, skip_validation=args.skip_validation)
+    return 0 if result else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
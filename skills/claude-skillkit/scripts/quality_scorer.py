@@ -30,13 +30,169 @@ Usage (Human-Readable):
     python quality_scorer.py /path/to/skill
     python quality_scorer.py /path/to/skill --detailed
     python quality_scorer.py /path/to/skill --export report.json
+
+Usage (CI Gate):
+    python quality_scorer.py /path/to/skill --quick --format json
+    # Scores structure, efficiency and security only (55 points)
+    python quality_scorer.py /path/to/skill --quiet
+    # No report output; exit code 0 if score >= 70%, else 1
+
+Usage (Batch):
+    python quality_scorer.py /path/to/skills --batch --format json
+    # Scores every subdirectory containing SKILL.md, across CPU cores
 """
 
 import argparse
-import json
+import mmap
+import os
 import re
+import sys
+from functools import cached_property
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# Shared JSON output helpers (orjson when installed, stdlib json otherwise)
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from utils.output_formatter import dumps_json_bytes, write_json
+
+
+# ========== COMPILED PATTERNS ==========
+# Compiled once at import: the security scan applies these to every file in
+# the skill tree, and the style checks to every sentence of SKILL.md.
+
+_SECRET_PATTERNS = (
+    r'api[_-]?key\s*=\s*["\'][^"\']+["\']',
+    r'password\s*=\s*["\'][^"\']+["\']',
+    r'secret\s*=\s*["\'][^"\']+["\']',
+    r'token\s*=\s*["\'][^"\']+["\']',
+    r'bearer\s+[A-Za-z0-9\-._~+/]+=*',
+)
+
+_DANGEROUS_PATTERNS = (
+    r'\beval\s*\(',
+    r'\bexec\s*\(',
+    r'shell\s*=\s*True',
+    r'os\.system\(',
+    r'subprocess\..*shell=True',
+)
+
+# Each set is joined into one alternation so a file is scanned once for
+# any of its members rather than once per pattern. The secret patterns are
+# all lowercase and run against lowercased text: with re.IGNORECASE the
+# alternation loses sre's first-character prefilter and ends up slower than
+# the five separate searches it replaces.
+_SECRETS_UNION = re.compile('|'.join(f'(?:{p})' for p in _SECRET_PATTERNS))
+_DANGER_UNION = re.compile('|'.join(f'(?:{p})' for p in _DANGEROUS_PATTERNS))
+
+_HEADER_RE = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+_EXAMPLES_HEADER_RE = re.compile(r'^##\s+Examples?\s*$', re.MULTILINE)
+_CODEBLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+_LIST_RE = re.compile(r'^[\-\*]\s', re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+_SENT_END_LINE_RE = re.compile(r'[.!?]\n')
+_SENT_SPLIT_RE = re.compile(r'[.!?]\s+')
+# Reference file stem: letters, digits, '-' and '_', with at least one
+# letter or digit (what isalnum() accepts once '-' and '_' are removed)
+_REF_NAME_RE = re.compile(r'[\w-]*[^\W_][\w-]*')
+
+# Imperative verbs commonly used in documentation
+_IMPERATIVE_VERBS = (
+    'use', 'run', 'execute', 'create', 'configure', 'install',
+    'check', 'validate', 'ensure', 'verify', 'set', 'define',
+    'specify', 'provide', 'include', 'add', 'remove', 'update',
+    'follow', 'read', 'write', 'call', 'invoke', 'load', 'scan',
+    'extract', 'detect', 'discover', 'generate', 'implement'
+)
+
+# A sentence is imperative when, after an optional list marker, one of its
+# first three words starts with an imperative verb; a single match call
+# replaces the words x verbs startswith loop. Leading whitespace (left when
+# markup at the start is stripped) is skipped without removing a marker.
+_IMPERATIVE_RE = re.compile(
+    r'(?:[\-\*\+]\s+|\s+)?(?:\S+\s+){0,2}(?:'
+    + '|'.join(sorted(_IMPERATIVE_VERBS, key=len, reverse=True))
+    + ')',
+    re.IGNORECASE,
+)
+
+# Keyword families for the content checks, matched against lowercased text
+_WHAT_KEYWORDS = ('comprehensive', 'provides', 'enables', 'supports', 'tools for',
+                  'guide', 'system', 'framework', 'utility')
+_WHEN_KEYWORDS = ('when', 'use when', 'trigger', 'for tasks', 'invoke',
+                  'if', 'needs to', 'requires', 'working with')
+_TRIGGER_KEYWORDS = ('use when', 'trigger', 'invoke', 'activate',
+                     'when claude needs', 'use this skill')
+_ACTION_VERBS = ('use', 'run', 'execute', 'create', 'configure',
+                 'install', 'check', 'validate', 'ensure')
+_ACTION_VERB_RE = re.compile(r'\b(?:' + '|'.join(_ACTION_VERBS) + r')\b')
+
+# Validation evidence: SKILL.md prose (lowercased) and script source (as-is)
+_VALIDATION_DOC_KEYWORDS = ('validate', 'check', 'verify')
+_VALIDATION_CODE_KEYWORDS = _VALIDATION_DOC_KEYWORDS + (
+    'assert', 'raise', 'isinstance', 'try:', 'except:', 'if not'
+)
+
+# File types whose contents the security checks read
+_SCANNED_SUFFIXES = frozenset({'.md', '.py', '.sh', '.yml', '.yaml'})
+
+# Category names in report order, and the subset --quick scores: the
+# cheap structural, token and security checks, skipping the sentence-level
+# content and style passes
+CATEGORIES = ('structure', 'content', 'efficiency', 'security', 'style')
+QUICK_CATEGORIES = ('structure', 'efficiency', 'security')
+
+# --export file extension -> QualityScorer export method
+_EXPORT_METHODS = {
+    '.json': 'export_json',
+    '.md': 'export_markdown',
+    '.markdown': 'export_markdown',
+}
+
+# JSON error responses, built once; 'message' is filled in per error
+_FILE_NOT_FOUND_ERROR = {
+    'status': 'error',
+    'error_type': 'FileNotFound',
+    'message': '',
+    'help': 'Ensure skill directory exists and contains SKILL.md'
+}
+_UNEXPECTED_ERROR = {
+    'status': 'error',
+    'error_type': 'UnexpectedError',
+    'message': '',
+    'help': 'Check skill structure and permissions'
+}
+_INVALID_EXPORT_ERROR = {
+    'status': 'error',
+    'error_type': 'InvalidExport',
+    'message': '',
+    'help': 'Use a .json, .md or .markdown extension for --export'
+}
+
+# Scanned files at least this large are decoded straight from a memory map
+_MMAP_MIN_SIZE = 8 * 1024
+
+
+def _read_scanned_file(path: Path) -> str:
+    """
+    Decode a scanned file as UTF-8.
+    
+    Large files are mapped and decoded from the page cache, skipping the
+    intermediate bytes buffer a buffered read allocates. The mapping is only
+    used when the file has no '\r', since text mode would translate those.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'\r') == -1:
+                    return str(mm, 'utf-8')
+    return path.read_text(encoding='utf-8')
 
 
 class QualityScorer:
@@ -63,6 +219,74 @@ class QualityScorer:
         
         if not (self.skill_path / "SKILL.md").exists():
             raise FileNotFoundError(f"SKILL.md not found in {skill_path}")
+        
+        # Read SKILL.md once, through the same decoder as every other scanned
+        # file; every helper works from these cached views
+        self._skill_md_text = _read_scanned_file(self.skill_path / "SKILL.md")
+        # Line count as readlines() would report it, without building the list
+        self._skill_md_line_count = self._skill_md_text.count('\n')
+        if self._skill_md_text and not self._skill_md_text.endswith('\n'):
+            self._skill_md_line_count += 1
+        self._skill_md_lower = self._skill_md_text.lower()
+        
+        # Markdown features shared by the content and style checks
+        self._skill_md_headers = _HEADER_RE.findall(self._skill_md_text)
+        self._has_code_blocks = '```' in self._skill_md_text
+        
+        # Walk the skill tree once; the structure and security checks share
+        # the per-suffix file lists and the decoded text of scanned files
+        self._files_by_suffix = {}
+        self._file_text = {self.skill_path / "SKILL.md": self._skill_md_text}
+        self._walk_skill_tree()
+    
+    def _walk_skill_tree(self):
+        """Bucket every file by suffix and cache the text of scanned types."""
+        for dirpath, _dirnames, filenames in os.walk(self.skill_path):
+            parent = Path(dirpath)
+            for name in filenames:
+                path = parent / name
+                self._files_by_suffix.setdefault(path.suffix, []).append(path)
+                if path.suffix not in _SCANNED_SUFFIXES or path in self._file_text:
+                    continue
+                try:
+                    self._file_text[path] = _read_scanned_file(path)
+                except (OSError, ValueError):  # ValueError covers UnicodeDecodeError
+                    continue  # Unreadable files are skipped by every scan
+    
+    @cached_property
+    def _reference_files(self) -> List[Path]:
+        """Markdown files directly inside references/."""
+        refs_dir = self.skill_path / "references"
+        return [p for p in self._files_by_suffix.get('.md', []) if p.parent == refs_dir]
+    
+    # ========== LAZY CATEGORIES ==========
+    # Each category is scored on first access and cached, so a caller that
+    # needs only some of them never runs the others.
+    
+    @cached_property
+    def structure(self) -> Dict:
+        """Structure category result."""
+        return self.score_structure()
+    
+    @cached_property
+    def content(self) -> Dict:
+        """Content category result."""
+        return self.score_content()
+    
+    @cached_property
+    def efficiency(self) -> Dict:
+        """Efficiency category result."""
+        return self.score_efficiency()
+    
+    @cached_property
+    def security(self) -> Dict:
+        """Security category result."""
+        return self.score_security()
+    
+    @cached_property
+    def style(self) -> Dict:
+        """Style category result."""
+        return self.score_style()
     
     # ========== SCORING CATEGORIES ==========
     
@@ -82,25 +306,25 @@ class QualityScorer:
         issues = []
         
         # Check YAML frontmatter
-        if self._has_valid_yaml():
+        if self._has_valid_yaml:
             score += 5
         else:
             issues.append("YAML frontmatter invalid or missing")
         
         # Check file organization
-        if self._has_proper_structure():
+        if self._has_proper_structure:
             score += 5
         else:
             issues.append("File structure not optimal")
         
         # Check progressive disclosure
-        if self._uses_progressive_disclosure():
+        if self._uses_progressive_disclosure:
             score += 5
         else:
             issues.append("Progressive disclosure not implemented")
         
         # Check references
-        if self._references_organized():
+        if self._references_organized:
             score += 5
         else:
             issues.append("References not properly organized")
@@ -108,7 +332,7 @@ class QualityScorer:
         return {
             'score': score,
             'max': 20,
-            'percentage': (score / 20) * 100,
+            'percentage': round((score / 20) * 100, 2),
             'issues': issues
         }
     
@@ -134,7 +358,7 @@ class QualityScorer:
             issues.append("Description missing WHAT or WHEN")
         
         # Check trigger conditions
-        if self._has_clear_triggers():
+        if self._has_clear_triggers:
             score += 5
         else:
             issues.append("Trigger conditions unclear")
@@ -146,7 +370,7 @@ class QualityScorer:
             issues.append("Writing style not agent-optimized")
         
         # Check examples
-        if self._has_inline_examples():
+        if self._has_inline_examples:
             score += 5
         else:
             issues.append("Examples missing or in separate section")
@@ -154,7 +378,7 @@ class QualityScorer:
         return {
             'score': score,
             'max': 30,
-            'percentage': (score / 30) * 100,
+            'percentage': round((score / 30) * 100, 2),
             'issues': issues
         }
     
@@ -172,11 +396,8 @@ class QualityScorer:
         score = 0
         issues = []
         
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            lines = f.readlines()
-            line_count = len(lines)
-            content = ''.join(lines)
+        line_count = self._skill_md_line_count
+        content = self._skill_md_text
         
         # Line count
         if line_count < 500:
@@ -195,7 +416,7 @@ class QualityScorer:
             issues.append(f"Estimated tokens high (~{estimated_tokens})")
         
         # Bloat detection (check for repetition)
-        if not self._detect_bloat(content):
+        if not self._has_bloat:
             score += 5
         else:
             issues.append("Content bloat detected")
@@ -203,7 +424,7 @@ class QualityScorer:
         return {
             'score': score,
             'max': 20,
-            'percentage': (score / 20) * 100,
+            'percentage': round((score / 20) * 100, 2),
             'issues': issues
         }
     
@@ -222,19 +443,19 @@ class QualityScorer:
         issues = []
         
         # Check for hardcoded secrets
-        if not self._has_hardcoded_secrets():
+        if not self._has_hardcoded_secrets:
             score += 5
         else:
             issues.append("Hardcoded secrets detected")
         
         # Check for dangerous patterns
-        if not self._has_dangerous_patterns():
+        if not self._has_dangerous_patterns:
             score += 5
         else:
             issues.append("Dangerous code patterns detected")
         
         # Check input validation
-        if self._has_input_validation():
+        if self._has_input_validation:
             score += 5
         else:
             issues.append("Input validation missing or weak")
@@ -242,7 +463,7 @@ class QualityScorer:
         return {
             'score': score,
             'max': 15,
-            'percentage': (score / 15) * 100,
+            'percentage': round((score / 15) * 100, 2),
             'issues': issues
         }
     
@@ -260,12 +481,8 @@ class QualityScorer:
         score = 0
         issues = []
         
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            content = f.read()
-        
         # Check imperative form
-        imperative_ratio = self._count_imperative_sentences(content)
+        imperative_ratio = self._count_imperative_sentences()
         if imperative_ratio > 0.5:
             score += 5
         elif imperative_ratio > 0.3:
@@ -275,7 +492,7 @@ class QualityScorer:
             issues.append("Not using imperative voice")
         
         # Check conciseness (sentence length)
-        avg_sentence_length = self._calculate_avg_sentence_length(content)
+        avg_sentence_length = self._calculate_avg_sentence_length()
         if avg_sentence_length < 20:
             score += 5
         elif avg_sentence_length < 30:
@@ -285,7 +502,7 @@ class QualityScorer:
             issues.append("Sentences too verbose")
         
         # Check headers
-        if self._has_clear_headers(content):
+        if self._has_clear_headers:
             score += 5
         else:
             issues.append("Headers not descriptive enough")
@@ -293,17 +510,16 @@ class QualityScorer:
         return {
             'score': score,
             'max': 15,
-            'percentage': (score / 15) * 100,
+            'percentage': round((score / 15) * 100, 2),
             'issues': issues
         }
     
     # ========== HELPER METHODS ==========
     
+    @cached_property
     def _has_valid_yaml(self) -> bool:
         """Check if YAML frontmatter is valid."""
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            content = f.read()
+        content = self._skill_md_text
         
         # Check for frontmatter delimiters
         if not content.startswith('---\n'):
@@ -322,6 +538,7 @@ class QualityScorer:
         
         return has_name and has_description
     
+    @cached_property
     def _has_proper_structure(self) -> bool:
         """Check if file structure is proper."""
         # Check for SKILL.md
@@ -331,25 +548,23 @@ class QualityScorer:
         refs_dir = self.skill_path / "references"
         if refs_dir.exists():
             # Should have .md files
-            has_ref_files = any(refs_dir.glob('*.md'))
+            has_ref_files = bool(self._reference_files)
             return has_skill_md and has_ref_files
         
         return has_skill_md
     
+    @cached_property
     def _uses_progressive_disclosure(self) -> bool:
         """Check if progressive disclosure is implemented."""
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            lines = f.readlines()
-        
         # Check if SKILL.md is reasonably sized
         refs_dir = self.skill_path / "references"
-        has_refs = refs_dir.exists() and any(refs_dir.glob('*.md'))
+        has_refs = refs_dir.exists() and bool(self._reference_files)
         
         # If file is short, progressive disclosure not needed
         # If file is long, should have references
-        return len(lines) < 500 or has_refs
+        return self._skill_md_line_count < 500 or has_refs
     
+    @cached_property
     def _references_organized(self) -> bool:
         """Check if references are organized."""
         refs_dir = self.skill_path / "references"
@@ -357,32 +572,18 @@ class QualityScorer:
             return True  # OK if no references needed
         
         # Check for proper filenames (lowercase, no spaces)
-        for ref_file in refs_dir.glob('*.md'):
-            if not ref_file.stem.replace('-', '').replace('_', '').isalnum():
-                return False
-            if ' ' in ref_file.stem:
-                return False
-        
-        return True
+        return all(_REF_NAME_RE.fullmatch(ref_file.stem) for ref_file in self._reference_files)
     
     def _score_description(self) -> int:
         """Score description quality (0-10)."""
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            content = f.read()
-        
         # Get frontmatter and first 500 chars
-        relevant_section = content[:1000].lower()
+        relevant_section = self._skill_md_lower[:1000]
         
         # Check for WHAT (task/functionality description)
-        what_keywords = ['comprehensive', 'provides', 'enables', 'supports', 'tools for', 
-                        'guide', 'system', 'framework', 'utility']
-        has_what = any(kw in relevant_section for kw in what_keywords)
+        has_what = any(kw in relevant_section for kw in _WHAT_KEYWORDS)
         
         # Check for WHEN (trigger conditions)
-        when_keywords = ['when', 'use when', 'trigger', 'for tasks', 'invoke', 
-                        'if', 'needs to', 'requires', 'working with']
-        has_when = any(kw in relevant_section for kw in when_keywords)
+        has_when = any(kw in relevant_section for kw in _WHEN_KEYWORDS)
         
         if has_what and has_when:
             return 10
@@ -391,77 +592,72 @@ class QualityScorer:
         else:
             return 0
     
+    @cached_property
     def _has_clear_triggers(self) -> bool:
         """Check for clear trigger conditions."""
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            content = f.read()[:1500]  # Check first 1500 chars
-        
-        trigger_keywords = ['use when', 'trigger', 'invoke', 'activate', 
-                           'when claude needs', 'use this skill']
-        return any(kw in content.lower() for kw in trigger_keywords)
+        content = self._skill_md_lower[:1500]  # Check first 1500 chars
+        return any(kw in content for kw in _TRIGGER_KEYWORDS)
     
     def _score_writing_style(self) -> int:
         """Score writing style (0-10)."""
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            content = f.read()
+        content = self._skill_md_text
         
         score = 0
         
         # Check for structured formatting (lists, code blocks, tables)
-        has_code_blocks = '```' in content
-        has_lists = bool(re.search(r'^[\-\*]\s', content, re.MULTILINE))
+        has_lists = bool(_LIST_RE.search(content))
         has_tables = '|' in content
         
-        if has_code_blocks or has_lists:
+        if self._has_code_blocks or has_lists:
             score += 3
         if has_tables:
             score += 2
         
-        # Check for direct, actionable language
-        action_verbs = ['use', 'run', 'execute', 'create', 'configure', 
-                       'install', 'check', 'validate', 'ensure']
-        verb_count = sum(content.lower().count(verb) for verb in action_verbs)
+        # Check for direct, actionable language. Verbs count as whole words
+        # only ('use' not inside 'user'), and since the score only tells
+        # more than 5 from more than 10, counting stops at 11
+        verb_count = sum(1 for _ in islice(_ACTION_VERB_RE.finditer(self._skill_md_lower), 11))
         if verb_count > 10:
             score += 3
         elif verb_count > 5:
             score += 2
         
         # Check for proper section organization
-        section_headers = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
-        if len(section_headers) >= 3:
+        if len(self._skill_md_headers) >= 3:
             score += 2
         
         return min(score, 10)
     
+    @cached_property
     def _has_inline_examples(self) -> bool:
         """Check if examples are inline."""
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            content = f.read()
-        
-        # Check for code blocks (indicates examples present)
-        has_code_blocks = '```' in content
-        
-        # Check if "Examples" is a separate section (bad practice)
-        has_separate_examples = bool(re.search(r'^##\s+Examples?\s*$', content, re.MULTILINE))
-        
-        return has_code_blocks and not has_separate_examples
+        # Code blocks indicate examples are present; a separate "Examples"
+        # section is bad practice
+        if not self._has_code_blocks:
+            return False
+        return not _EXAMPLES_HEADER_RE.search(self._skill_md_text)
     
-    def _detect_bloat(self, content: str) -> bool:
+    @cached_property
+    def _has_bloat(self) -> bool:
         """Detect content bloat."""
-        # Check for very long sections
-        sections = content.split('\n## ')
-        for section in sections:
-            section_lines = section.split('\n')
-            if len(section_lines) > 150:
+        content = self._skill_md_text
+        
+        # Check for very long sections, measured in place between '\n## '
+        # separators rather than by splitting out copies of each section
+        start = 0
+        while True:
+            end = content.find('\n## ', start)
+            if content.count('\n', start, len(content) if end == -1 else end) >= 150:
                 return True  # Section too long
-        
-        # Check for excessive repetition
-        lines = content.split('\n')
-        if len(lines) > 100:
-            # Sample check: look for repeated patterns
+            if end == -1:
+                break
+            start = end + 4
+        
+        # Check for excessive repetition. set() over one split is a single
+        # C-level pass; a Python loop that exits early once the unique
+        # ratio is decided costs more per line than it saves
+        if content.count('\n') >= 100:
+            lines = content.split('\n')
             line_set = set(lines)
             repetition_ratio = len(line_set) / len(lines)
             if repetition_ratio < 0.7:  # Less than 70% unique lines
@@ -469,102 +665,67 @@ class QualityScorer:
         
         return False
     
+    @cached_property
     def _has_hardcoded_secrets(self) -> bool:
         """Check for hardcoded secrets."""
-        patterns = [
-            r'api[_-]?key\s*=\s*["\'][^"\']+["\']',
-            r'password\s*=\s*["\'][^"\']+["\']',
-            r'secret\s*=\s*["\'][^"\']+["\']',
-            r'token\s*=\s*["\'][^"\']+["\']',
-            r'bearer\s+[A-Za-z0-9\-._~+/]+=*',
-        ]
-        
-        # Scan all files in skill directory
-        for file in self.skill_path.rglob('*'):
-            if file.is_file() and file.suffix in ['.md', '.py', '.sh', '.yml', '.yaml']:
-                try:
-                    with open(file, encoding='utf-8') as f:
-                        content = f.read()
-                        for pattern in patterns:
-                            if re.search(pattern, content, re.IGNORECASE):
-                                return True
-                except:
-                    continue
-        
-        return False
+        # Scan all text files in skill directory
+        return any(
+            _SECRETS_UNION.search(content.lower()) for content in self._file_text.values()
+        )
     
+    @cached_property
     def _has_dangerous_patterns(self) -> bool:
         """Check for dangerous code patterns."""
-        dangerous_patterns = [
-            r'\beval\s*\(',
-            r'\bexec\s*\(',
-            r'shell\s*=\s*True',
-            r'os\.system\(',
-            r'subprocess\..*shell=True',
-        ]
-        
         # Scan Python scripts
-        for script in self.skill_path.rglob('*.py'):
-            try:
-                with open(script, encoding='utf-8') as f:
-                    content = f.read()
-                    for pattern in dangerous_patterns:
-                        if re.search(pattern, content):
-                            return True
-            except:
-                continue
-        
-        return False
+        return any(
+            _DANGER_UNION.search(self._file_text.get(script, ''))
+            for script in self._files_by_suffix.get('.py', [])
+        )
     
+    @cached_property
     def _has_input_validation(self) -> bool:
         """Check if input validation exists."""
-        validation_keywords = ['validate', 'check', 'verify', 'assert', 'raise', 
-                              'isinstance', 'try:', 'except:', 'if not']
-        
-        # Check SKILL.md for validation mentions
-        skill_md = self.skill_path / "SKILL.md"
-        with open(skill_md) as f:
-            skill_content = f.read()
-            has_validation_docs = any(kw in skill_content.lower() for kw in validation_keywords[:3])
+        # Check SKILL.md for validation mentions; documented validation is
+        # enough on its own, so the script scan only runs without it
+        if any(kw in self._skill_md_lower for kw in _VALIDATION_DOC_KEYWORDS):
+            return True
         
         # Check Python scripts for validation code
-        has_validation_code = False
-        for script in self.skill_path.rglob('*.py'):
-            try:
-                with open(script, encoding='utf-8') as f:
-                    content = f.read()
-                    if any(kw in content for kw in validation_keywords):
-                        has_validation_code = True
-                        break
-            except:
-                continue
-        
-        return has_validation_docs or has_validation_code
-    
-    def _count_imperative_sentences(self, content: str) -> float:
-        """Calculate ratio of imperative sentences."""
-        # Imperative verbs commonly used in documentation
-        imperative_verbs = [
-            'use', 'run', 'execute', 'create', 'configure', 'install',
-            'check', 'validate', 'ensure', 'verify', 'set', 'define',
-            'specify', 'provide', 'include', 'add', 'remove', 'update',
-            'follow', 'read', 'write', 'call', 'invoke', 'load', 'scan',
-            'extract', 'detect', 'discover', 'generate', 'implement'
-        ]
-
-        # Remove YAML frontmatter
-        processed_content = content
+        for script in self._files_by_suffix.get('.py', []):
+            content = self._file_text.get(script, '')
+            if any(kw in content for kw in _VALIDATION_CODE_KEYWORDS):
+                return True
+        
+        return False
+    
+    @cached_property
+    def _prose_text(self) -> str:
+        """SKILL.md with fenced code blocks removed."""
+        return _CODEBLOCK_RE.sub('', self._skill_md_text)
+    
+    @cached_property
+    def _body_prose_text(self) -> str:
+        """SKILL.md without YAML frontmatter or fenced code blocks."""
+        content = self._skill_md_text
         if content.startswith('---\n'):
             end_idx = content.find('\n---\n', 4)
             if end_idx != -1:
-                processed_content = content[end_idx + 5:]
-
-        # Remove code blocks to avoid counting code as sentences
-        processed_content = re.sub(r'```.*?```', '', processed_content, flags=re.DOTALL)
+                body_start = end_idx + 5
+                # Without a fence in the frontmatter, stripping the whole
+                # file leaves that prefix untouched, so the shared pass can
+                # simply be sliced
+                if '```' in content[:body_start]:
+                    return _CODEBLOCK_RE.sub('', content[body_start:])
+                return self._prose_text[body_start:]
+        return self._prose_text
+    
+    def _count_imperative_sentences(self) -> float:
+        """Calculate ratio of imperative sentences."""
+        # Body text, code blocks removed to avoid counting code as sentences
+        processed_content = self._body_prose_text
 
         # Split into sentences (approximate)
-        sentences = re.split(r'[.!?]\n', processed_content)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
+        sentences = [s for s in map(str.strip, _SENT_END_LINE_RE.split(processed_content)) if len(s) > 10]
 
         if not sentences:
             return 0.0
@@ -572,51 +733,39 @@ class QualityScorer:
         # Count sentences with imperative verbs
         imperative_count = 0
         for sentence in sentences:
-            # Strip markdown formatting (bold, italic, inline code)
-            clean_sentence = re.sub(r'\*\*([^*]+)\*\*', r'\1', sentence)
-            clean_sentence = re.sub(r'\*([^*]+)\*', r'\1', clean_sentence)
-            clean_sentence = re.sub(r'`([^`]+)`', r'\1', clean_sentence)
-            clean_sentence = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', clean_sentence)
-
-            # Remove special markers and colons at start
-            clean_sentence = re.sub(r'^[\-\*\+]\s+', '', clean_sentence)
-            clean_sentence = clean_sentence.strip()
-
-            if not clean_sentence:
-                continue
-
-            # Get first 3 words to check for imperative
-            words = clean_sentence.lower().split()
-            first_words = words[:3] if len(words) >= 3 else words
-
-            # Check if any of first 3 words is imperative verb
-            has_imperative = any(
-                any(word.startswith(verb) for verb in imperative_verbs)
-                for word in first_words
-            )
-
-            if has_imperative:
+            # Strip markdown formatting (bold, italic, inline code, links)
+            # per sentence, so emphasis never spans a sentence end; each
+            # pattern only runs when its opening character is present
+            if '*' in sentence:
+                sentence = _BOLD_RE.sub(r'\1', sentence)
+                sentence = _ITALIC_RE.sub(r'\1', sentence)
+            if '`' in sentence:
+                sentence = _INLINE_CODE_RE.sub(r'\1', sentence)
+            if '[' in sentence:
+                sentence = _LINK_RE.sub(r'\1', sentence)
+            
+            if _IMPERATIVE_RE.match(sentence):
                 imperative_count += 1
 
         return imperative_count / len(sentences)
     
-    def _calculate_avg_sentence_length(self, content: str) -> float:
+    def _calculate_avg_sentence_length(self) -> float:
         """Calculate average sentence length in words."""
-        # Remove code blocks to avoid skewing results
-        content_no_code = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-        
-        sentences = re.split(r'[.!?]\s+', content_no_code)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
+        # Code blocks removed to avoid skewing results
+        sentences = [s for s in map(str.strip, _SENT_SPLIT_RE.split(self._prose_text)) if len(s) > 10]
         
         if not sentences:
             return 0.0
         
-        total_words = sum(len(s.split()) for s in sentences)
+        # Sentences are stripped and non-empty, so one split of the joined
+        # text counts the same words as splitting each sentence
+        total_words = len(' '.join(sentences).split())
         return total_words / len(sentences)
     
-    def _has_clear_headers(self, content: str) -> bool:
+    @cached_property
+    def _has_clear_headers(self) -> bool:
         """Check if headers are clear and descriptive."""
-        headers = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
+        headers = self._skill_md_headers
         
         if not headers:
             return False
@@ -642,25 +791,31 @@ class QualityScorer:
     
     # ========== MAIN SCORING ==========
     
-    def calculate_overall_score(self) -> Dict:
+    def calculate_overall_score(self, quick: bool = False) -> Dict:
         """
         Calculate overall quality score.
         
         Combines all category scores into overall rating.
         
+        Args:
+            quick: If True, score only QUICK_CATEGORIES; totals and grade
+                are then relative to their combined maximum
+        
         Returns:
             Dict with overall score and breakdown
         """
-        # Score each category
-        self.scores['structure'] = self.score_structure()
-        self.scores['content'] = self.score_content()
-        self.scores['efficiency'] = self.score_efficiency()
-        self.scores['security'] = self.score_security()
-        self.scores['style'] = self.score_style()
+        # Score each category. This stays sequential: after __init__ the
+        # categories are pure regex/str work, which holds the GIL, so a
+        # thread pool only adds scheduling overhead.
+        categories = QUICK_CATEGORIES if quick else CATEGORIES
+        self.scores = {category: getattr(self, category) for category in categories}
         
         # Calculate total
         total_score = sum(s['score'] for s in self.scores.values())
         total_max = sum(s['max'] for s in self.scores.values())
+        # Category percentages arrive rounded to 2 dp. This one stays exact:
+        # with the quick maximum of 55, rounding first would turn e.g.
+        # 14.545...% into 14.55% and the text report's 14.5% into 14.6%
         overall_percentage = (total_score / total_max) * 100
         
         # Collect all issues
@@ -722,9 +877,14 @@ class QualityScorer:
         print("  â€¢ File 10: Architecture standards")
         print("="*60 + "\n")
     
-    def export_json(self, filepath: str, overall: Dict):
-        """Export report as JSON."""
-        report = {
+    def build_report(self, overall: Dict) -> Dict:
+        """
+        Build the JSON report for an overall score.
+        
+        Shared by export_json() and the --format json output, which adds
+        only a leading 'status' key.
+        """
+        return {
             'skill_path': str(self.skill_path),
             'skill_name': self.skill_path.name,
             'overall': {
@@ -733,20 +893,18 @@ class QualityScorer:
                 'percentage': round(overall['percentage'], 2),
                 'grade': overall['grade']
             },
-            'categories': {
-                category: {
-                    'score': data['score'],
-                    'max': data['max'],
-                    'percentage': round(data['percentage'], 2),
-                    'issues': data['issues']
-                }
-                for category, data in overall['categories'].items()
-            },
+            # Category results already have the report's shape and rounding
+            'categories': overall['categories'],
             'recommendations': overall['issues']
         }
+    
+    def export_json(self, filepath: str, overall: Dict):
+        """Export report as JSON."""
+        report = self.build_report(overall)
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Encode fully, then write once: reports are a few KB, and streaming
+        # with json.dump(report, f) writes per token and is slower here
+        Path(filepath).write_bytes(dumps_json_bytes(report))
     
     def export_markdown(self, filepath: str, overall: Dict):
         """Export report as Markdown."""
@@ -804,8 +962,170 @@ class QualityScorer:
         lines.append("- File 07: Security guidelines")
         lines.append("- File 10: Architecture standards")
         
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
+        # Joined up front, so the whole report is one UTF-8 write
+        Path(filepath).write_text('\n'.join(lines), encoding='utf-8')
+
+
+def score_skill(skill_path: str, quick: bool = False) -> Dict:
+    """
+    Score one skill and return its JSON report.
+    
+    Used by --batch, typically in a worker process, so failures come back
+    as error reports (tagged with skill_path) instead of exceptions.
+    """
+    try:
+        scorer = QualityScorer(skill_path)
+        overall = scorer.calculate_overall_score(quick=quick)
+    except FileNotFoundError as e:
+        return {**_FILE_NOT_FOUND_ERROR, 'message': str(e), 'skill_path': skill_path}
+    except Exception as e:
+        return {**_UNEXPECTED_ERROR, 'message': str(e), 'skill_path': skill_path}
+    return {'status': 'success', **scorer.build_report(overall)}
+
+
+def score_batch(batch_dir: str, quick: bool = False) -> List[Dict]:
+    """
+    Score every skill directly inside batch_dir.
+    
+    Skills are the subdirectories containing SKILL.md, reported in name
+    order. With several skills and CPUs they are scored in a process pool,
+    since scoring is CPU-bound regex work that threads cannot overlap.
+    
+    Returns:
+        One score_skill() report per skill
+    """
+    root = Path(batch_dir)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Batch directory not found: {batch_dir}")
+    
+    skills = sorted(str(p) for p in root.iterdir() if (p / "SKILL.md").is_file())
+    workers = min(len(skills), os.cpu_count() or 1)
+    if workers < 2:
+        return [score_skill(skill, quick) for skill in skills]
+    
+    # Imported here: concurrent.futures.process (with multiprocessing) is
+    # the script's costliest import and only a parallel batch needs it
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(score_skill, skills, repeat(quick)))
+
+
+def _batch_passed(report: Dict) -> bool:
+    """True if a batch entry scored at or above the 70% pass mark."""
+    return report['status'] == 'success' and report['overall']['percentage'] >= 70
+
+
+def display_batch(reports: List[Dict]):
+    """Display one summary line per skill of a batch run."""
+    print("\n" + "="*60)
+    print("SKILL QUALITY BATCH REPORT")
+    print("="*60 + "\n")
+    for report in reports:
+        if report['status'] == 'success':
+            overall = report['overall']
+            print(f"  {report['skill_name']:30} {overall['score']:3}/{overall['max']:3} "
+                  f"({overall['percentage']:5.1f}%)  {overall['grade']}")
+        else:
+            print(f"  {Path(report['skill_path']).name:30} ERROR: {report['message']}")
+    
+    passed = sum(1 for report in reports if _batch_passed(report))
+    print(f"\nPassed (>= 70%): {passed}/{len(reports)}")
+    print("="*60 + "\n")
+
+
+def _run_batch(args) -> int:
+    """Score a directory of skills (--batch) and report them together."""
+    reports = score_batch(args.skill_path, quick=args.quick)
+    
+    if args.format == 'json' and not args.quiet:
+        write_json({
+            'status': 'success',
+            'batch_path': args.skill_path,
+            'skill_count': len(reports),
+            'passed': sum(1 for report in reports if _batch_passed(report)),
+            'skills': reports
+        })
+        return 0
+    
+    if not args.quiet:
+        display_batch(reports)
+    
+    # Exit code: 0 only if every skill passed
+    return 0 if all(_batch_passed(report) for report in reports) else 1
+
+
+def _export_method(filepath: str) -> Optional[str]:
+    """QualityScorer export method for an --export path, None if unsupported."""
+    return _EXPORT_METHODS.get(os.path.splitext(filepath)[1].lower())
+
+
+def _export_and_exit_code(scorer: QualityScorer, overall: Dict, args) -> int:
+    """Write the --export file, if any, and return the score exit code."""
+    if args.export:
+        method = _export_method(args.export)
+        if method is None:
+            print(f"âš ï¸  Unknown export format. Use .json or .md extension.")
+            return 1
+        
+        getattr(scorer, method)(args.export, overall)
+        if not args.quiet:
+            print(f"âœ… Report exported to {args.export}")
+    
+    # Return exit code based on score: 0 at or above the 70% pass mark
+    return 0 if overall['percentage'] >= 70 else 1
+
+
+def _run_json(args) -> int:
+    """Agent-layer run: the report or error goes to stdout as JSON."""
+    try:
+        if args.batch:
+            return _run_batch(args)
+        
+        # Reject a bad --export path up front, as JSON, before scoring
+        method = _export_method(args.export) if args.export else None
+        if args.export and method is None:
+            write_json({**_INVALID_EXPORT_ERROR,
+                        'message': f"Unknown export format: {args.export}"})
+            return 1
+        
+        scorer = QualityScorer(args.skill_path, detailed=args.detailed)
+        overall = scorer.calculate_overall_score(quick=args.quick)
+        # Export silently: stdout carries only the JSON response
+        if method is not None:
+            getattr(scorer, method)(args.export, overall)
+        if args.quiet:
+            return 0 if overall['percentage'] >= 70 else 1
+        
+        write_json({'status': 'success', **scorer.build_report(overall)})
+        return 0
+    
+    except FileNotFoundError as e:
+        write_json({**_FILE_NOT_FOUND_ERROR, 'message': str(e)})
+        return 1
+    except Exception as e:
+        write_json({**_UNEXPECTED_ERROR, 'message': str(e)})
+        return 2
+
+
+def _run_text(args) -> int:
+    """Human-readable run: console report, optional export."""
+    try:
+        if args.batch:
+            return _run_batch(args)
+        
+        scorer = QualityScorer(args.skill_path, detailed=args.detailed)
+        overall = scorer.calculate_overall_score(quick=args.quick)
+        if not args.quiet:
+            scorer.display_report(overall)
+        
+        return _export_and_exit_code(scorer, overall, args)
+    
+    except FileNotFoundError as e:
+        print(f"âŒ Error: {e}")
+        return 1
+    except Exception as e:
+        print(f"âŒ Unexpected error: {e}")
+        return 2
 
 
 def main():
@@ -817,7 +1137,7 @@ def main():
     parser.add_argument(
         'skill_path',
         type=str,
-        help='Path to skill directory'
+        help='Path to skill directory (with --batch: directory of skills)'
     )
     parser.add_argument(
         '--format',
@@ -831,91 +1151,34 @@ def main():
         action='store_true',
         help='Show detailed category breakdown (text format only)'
     )
+    parser.add_argument(
+        '--quick',
+        action='store_true',
+        help='Score only structure, efficiency and security (fast CI gate)'
+    )
     parser.add_argument(
         '--export',
         type=str,
         help='Export report to file (JSON or MD format based on extension)'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Print no report, only errors; exit code 0 if score >= 70%%, else 1'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Score every skill subdirectory of skill_path in parallel'
+    )
     
     args = parser.parse_args()
+    if args.batch and args.export:
+        parser.error('--export is not supported with --batch')
     
-    try:
-        scorer = QualityScorer(args.skill_path, detailed=args.detailed)
-        overall = scorer.calculate_overall_score()
-        
-        # Agent-layer JSON output (stdout)
-        if args.format == 'json':
-            import sys
-            report = {
-                'status': 'success',
-                'skill_path': str(scorer.skill_path),
-                'skill_name': scorer.skill_path.name,
-                'overall': {
-                    'score': overall['score'],
-                    'max': overall['max'],
-                    'percentage': round(overall['percentage'], 2),
-                    'grade': overall['grade']
-                },
-                'categories': {
-                    category: {
-                        'score': data['score'],
-                        'max': data['max'],
-                        'percentage': round(data['percentage'], 2),
-                        'issues': data['issues']
-                    }
-                    for category, data in overall['categories'].items()
-                },
-                'recommendations': overall['issues']
-            }
-            print(json.dumps(report, indent=2))
-            return 0
-        
-        # Human-readable text output (console)
-        scorer.display_report(overall)
-        
-        if args.export:
-            export_path = Path(args.export)
-            
-            if export_path.suffix.lower() == '.json':
-                scorer.export_json(args.export, overall)
-                print(f"âœ… Report exported to {args.export}")
-            elif export_path.suffix.lower() in ['.md', '.markdown']:
-                scorer.export_markdown(args.export, overall)
-                print(f"âœ… Report exported to {args.export}")
-            else:
-                print(f"âš ï¸  Unknown export format. Use .json or .md extension.")
-                return 1
-        
-        # Return exit code based on score
-        if overall['percentage'] >= 70:
-            return 0
-        else:
-            return 1
-            
-    except FileNotFoundError as e:
-        if args.format == 'json':
-            error_report = {
-                'status': 'error',
-                'error_type': 'FileNotFound',
-                'message': str(e),
-                'help': 'Ensure skill directory exists and contains SKILL.md'
-            }
-            print(json.dumps(error_report, indent=2))
-        else:
-            print(f"âŒ Error: {e}")
-        return 1
-    except Exception as e:
-        if args.format == 'json':
-            error_report = {
-                'status': 'error',
-                'error_type': 'UnexpectedError',
-                'message': str(e),
-                'help': 'Check skill structure and permissions'
-            }
-            print(json.dumps(error_report, indent=2))
-        else:
-            print(f"âŒ Unexpected error: {e}")
-        return 2
+    # Each output format owns its error reporting, so pick it once here
+    handler = _run_json if args.format == 'json' else _run_text
+    return handler(args)
 
 
 if __name__ == "__main__":
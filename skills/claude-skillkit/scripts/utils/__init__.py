@@ -9,6 +9,9 @@ Modules:
 
 from .output_formatter import (
     add_format_argument,
+    dumps_json,
+    dumps_json_bytes,
+    write_json,
     output_json,
     output_error,
     format_success_response,
@@ -32,6 +35,9 @@ from .reference_validator import (
 __all__ = [
     # Output formatting (v1.0)
     'add_format_argument',
+    'dumps_json',
+    'dumps_json_bytes',
+    'write_json',
     'output_json',
     'output_error',
     'format_success_response',
@@ -25,6 +25,11 @@ import sys
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson  # Optional accelerator, stdlib json is used when absent
+except ImportError:
+    orjson = None
+
 
 def add_format_argument(parser, default='text'):
     """
@@ -51,6 +56,79 @@ def add_format_argument(parser, default='text'):
     )
 
 
+def dumps_json_bytes(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data as UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder
+    otherwise, so scripts keep working without external dependencies.
+    Either way non-ASCII text (e.g. skill names, issue messages) is written
+    as UTF-8 rather than as \\uXXXX escapes. Data orjson cannot encode is
+    retried with the stdlib encoder.
+
+    Args:
+        data: JSON-serializable object
+        indent: 2-space indentation (default) or a single line, e.g. for
+            newline-delimited JSON streams
+
+    Returns:
+        JSON bytes (no trailing newline)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # orjson.JSONEncodeError: values orjson rejects but stdlib json
+            # encodes, e.g. lone surrogates or integers beyond 64 bits
+            pass
+    text = json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+    # Lone surrogates (undecodable file names) can't be UTF-8 encoded;
+    # backslashreplace writes them as the same \udcXX escape JSON uses
+    return text.encode('utf-8', 'backslashreplace')
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data as 2-space indented JSON text.
+
+    Same encoding rules as dumps_json_bytes().
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        Indented JSON string (no trailing newline)
+    """
+    return dumps_json_bytes(data).decode('utf-8')
+
+
+def write_json(data: Any, file=None) -> None:
+    """
+    Write data as indented JSON plus newline to a stream.
+
+    Writes bytes straight to the stream's binary buffer, skipping the
+    str round-trip and text-layer encoding of print(). Streams without a
+    buffer (e.g. io.StringIO) get the text form instead.
+
+    Args:
+        data: JSON-serializable object
+        file: Optional file object (default: sys.stdout)
+    """
+    if file is None:
+        file = sys.stdout
+
+    buffer = getattr(file, 'buffer', None)
+    if buffer is None:
+        print(dumps_json(data), file=file)
+        return
+
+    # Keep ordering with any text already written to the stream
+    file.flush()
+    buffer.write(dumps_json_bytes(data))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
 def format_success_response(
     data: Dict[str, Any],
     tool_name: str,
@@ -24,7 +24,7 @@ Reference: TEST-REPORT.md Issue #5 - Validation Doesn't Check File Existence
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Optional, Any
 from dataclasses import dataclass, field
 
 
@@ -77,10 +77,15 @@ class CrossReferenceValidator:
         self.skill_path = Path(skill_path)
         self.skill_md_path = self.skill_path / 'SKILL.md'
 
-    def validate_skill_md(self) -> ValidationResult:
+    def validate_skill_md(self, files: Optional[Iterable[Tuple[str, str]]] = None) -> ValidationResult:
         """
         Validate SKILL.md references against actual files.
 
+        Args:
+            files: Optional (path, rel_path) of every file in the skill, from
+                a walk the caller already made (the packager's); the skill
+                directory is scanned if omitted
+
         Returns:
             ValidationResult with status, missing/orphaned files, and suggestions
         """
@@ -124,7 +129,11 @@ class CrossReferenceValidator:
                 missing_files.append(ref)
 
         # Find orphaned files (exist but not referenced)
-        orphaned_files = self._find_orphaned_files(referenced_files)
+        if files is None:
+            candidates = self._scan_files()
+        else:
+            candidates = self._candidates_from_files(files)
+        orphaned_files = self._find_orphaned_files(referenced_files, candidates)
 
         # Determine status and message
         if missing_files or orphaned_files:
@@ -193,12 +202,60 @@ class CrossReferenceValidator:
 
         return sorted(list(normalized))
 
-    def _find_orphaned_files(self, referenced_files: List[str]) -> List[str]:
+    def _scan_files(self) -> List[Tuple[str, str]]:
+        """
+        Walk the skill directory once with os.scandir.
+
+        Hidden and symlinked directories are not descended into and
+        unreadable directories are skipped, as with os.walk.
+
+        Returns:
+            (name, rel_path) of every non-directory entry outside hidden
+            directories, for the orphan check
+        """
+        root = str(self.skill_path)
+        prefix_len = len(root) + 1
+        candidates = []
+        stack = [root]
+
+        while stack:
+            path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            if not entry.is_symlink() and not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                            continue
+                        candidates.append((entry.name, entry.path[prefix_len:]))
+            except OSError:
+                continue
+
+        return candidates
+
+    @staticmethod
+    def _candidates_from_files(files: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Orphan-check candidates from an existing (path, rel_path) file list.
+
+        Same shape as _scan_files(): files under hidden directories are
+        dropped, hidden files themselves are kept.
+        """
+        candidates = []
+        for _, rel_path in files:
+            parent, _, name = rel_path.rpartition(os.sep)
+            if not (parent.startswith('.') or (os.sep + '.') in parent):
+                candidates.append((name, rel_path))
+        return candidates
+
+    def _find_orphaned_files(self, referenced_files: List[str],
+                             candidates: Optional[List[Tuple[str, str]]] = None) -> List[str]:
         """
         Find files that exist but are not referenced in SKILL.md.
 
         Args:
             referenced_files: List of referenced files
+            candidates: (name, rel_path) pairs from _scan_files(); scanned if omitted
 
         Returns:
             List of orphaned files found
@@ -206,28 +263,23 @@ class CrossReferenceValidator:
         orphaned = []
         referenced_normalized = set(referenced_files)
 
-        # Walk through skill directory
-        for root, dirs, files in os.walk(self.skill_path):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-            for file in files:
-                if file.endswith(('.md', '.py', '.txt', '.json', '.yaml')):
-                    full_path = Path(root) / file
-                    rel_path = str(full_path.relative_to(self.skill_path))
-
-                    # Check if referenced
-                    is_referenced = any(
-                        rel_path == ref or
-                        rel_path.endswith(ref) or
-                        ref.endswith(file)
-                        for ref in referenced_normalized
-                    )
-
-                    if not is_referenced:
-                        # Exclude common non-referenced files
-                        if file not in ['SKILL.md', '.gitignore', 'README.md']:
-                            orphaned.append(rel_path)
+        if candidates is None:
+            candidates = self._scan_files()
+
+        for file, rel_path in candidates:
+            if file.endswith(('.md', '.py', '.txt', '.json', '.yaml')):
+                # Check if referenced
+                is_referenced = any(
+                    rel_path == ref or
+                    rel_path.endswith(ref) or
+                    ref.endswith(file)
+                    for ref in referenced_normalized
+                )
+
+                if not is_referenced:
+                    # Exclude common non-referenced files
+                    if file not in ['SKILL.md', '.gitignore', 'README.md']:
+                        orphaned.append(rel_path)
 
         return sorted(orphaned)
 
@@ -263,7 +315,8 @@ class CrossReferenceValidator:
 
         return " | ".join(suggestions) if suggestions else ""
 
-    def validate_skill_directory(self, strict: bool = False) -> ValidationResult:
+    def validate_skill_directory(self, strict: bool = False,
+                                 files: Optional[Iterable[Tuple[str, str]]] = None) -> ValidationResult:
         """
         Comprehensive validation of entire skill directory.
 
@@ -274,11 +327,12 @@ class CrossReferenceValidator:
 
         Args:
             strict: If True, orphaned files cause failure. If False, just warning.
+            files: Optional file list, passed on to validate_skill_md()
 
         Returns:
             ValidationResult
         """
-        result = self.validate_skill_md()
+        result = self.validate_skill_md(files)
 
         # If strict mode, orphaned files cause failure
         if strict and result.orphaned_files:
@@ -345,17 +399,20 @@ class SkillPackageValidator:
         self.skill_path = Path(skill_path)
         self.ref_validator = CrossReferenceValidator(skill_path)
 
-    def validate_for_packaging(self, strict: bool = False) -> ValidationResult:
+    def validate_for_packaging(self, strict: bool = False,
+                               files: Optional[Iterable[Tuple[str, str]]] = None) -> ValidationResult:
         """
         Validate skill is ready for packaging.
 
         Args:
             strict: If True, any issues cause failure
+            files: Optional (path, rel_path) list from the packager's walk,
+                reused so the skill directory is not walked a second time
 
         Returns:
             ValidationResult indicating if safe to package
         """
-        result = self.ref_validator.validate_skill_directory(strict=strict)
+        result = self.ref_validator.validate_skill_directory(strict=strict, files=files)
 
         if result.status == 'fail':
             result.suggestion = (
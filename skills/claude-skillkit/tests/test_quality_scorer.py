@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Regression tests for quality_scorer.py.
+
+Run from the repository root:
+    python -m unittest discover skills/claude-skillkit/tests
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import quality_scorer
+from quality_scorer import QualityScorer
+
+
+# Italic emphasis opens in one sentence and closes after the next one's
+# period. Markup is stripped per sentence, so "*Read" stays a non-verb
+# first word and "here.*" is not a sentence end.
+SPANNING_EMPHASIS_SKILL = """---
+name: spanning-emphasis
+description: Test skill
+---
+# Spanning Emphasis
+
+*Read the full guide before you start.
+Then the rest follows here.*
+Use the scorer for every skill.
+- **Run** the checks before packaging.
+"""
+
+
+class ImperativeRatioTest(unittest.TestCase):
+    """Imperative voice detection in the style category."""
+
+    def _scorer(self, skill_md: str) -> QualityScorer:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        Path(tmp.name, "SKILL.md").write_text(skill_md, encoding='utf-8')
+        return QualityScorer(tmp.name)
+
+    def test_emphasis_spanning_sentence_end(self):
+        scorer = self._scorer(SPANNING_EMPHASIS_SKILL)
+        # Sentences: "# Spanning ... *Read ... start" (no),
+        # "Then ... here.*\nUse ... skill" (no), "- **Run** ... packaging" (yes)
+        self.assertAlmostEqual(scorer._count_imperative_sentences(), 1 / 3)
+
+
+class JsonExportTest(unittest.TestCase):
+    """--export in --format json mode, with and without --quiet."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.skill = self.tmp / "skill"
+        self.skill.mkdir()
+        (self.skill / "SKILL.md").write_text(SPANNING_EMPHASIS_SKILL, encoding='utf-8')
+
+    def _run(self, *argv: str):
+        stdout = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['quality_scorer.py', str(self.skill), *argv]), \
+                redirect_stdout(stdout):
+            code = quality_scorer.main()
+        return code, stdout.getvalue()
+
+    def test_export_written_with_and_without_quiet(self):
+        for argv in ((), ('--quiet',)):
+            with self.subTest(argv=argv):
+                export = self.tmp / f"report{len(argv)}.json"
+                _, out = self._run('--format', 'json', '--export', str(export), *argv)
+                self.assertEqual(json.loads(export.read_text(encoding='utf-8'))['skill_name'], 'skill')
+                if not argv:
+                    # stdout stays a single JSON document
+                    self.assertEqual(json.loads(out)['status'], 'success')
+
+    def test_unknown_export_extension_is_a_json_error(self):
+        code, out = self._run('--format', 'json', '--export', str(self.tmp / "report.txt"))
+        self.assertEqual(code, 1)
+        self.assertEqual(json.loads(out)['error_type'], 'InvalidExport')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Regression tests for utils/reference_validator.py.
+
+Run from the repository root:
+    python -m unittest discover skills/claude-skillkit/tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from package_skill import _scandir_files
+from utils.reference_validator import CrossReferenceValidator
+
+
+SKILL_MD = """---
+name: refs
+description: Test skill
+---
+# Refs
+
+See [the guide](references/guide.md) and [a missing page](references/gone.md).
+"""
+
+
+class SkillTreeTestCase(unittest.TestCase):
+    """A small temp skill with nested, hidden and unreferenced files."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.skill = Path(tmp.name)
+        (self.skill / "SKILL.md").write_text(SKILL_MD, encoding='utf-8')
+        (self.skill / "references" / "deep").mkdir(parents=True)
+        (self.skill / "references" / "guide.md").write_text("guide", encoding='utf-8')
+        (self.skill / "references" / "deep" / "extra.md").write_text("extra", encoding='utf-8')
+        # Hidden directories are never reported as orphans
+        (self.skill / ".cache").mkdir()
+        (self.skill / ".cache" / "notes.md").write_text("notes", encoding='utf-8')
+
+
+class ListAllReferencesTest(SkillTreeTestCase):
+    """list_all_references() scans the tree itself when given no file list."""
+
+    def test_orphans_valid_and_missing(self):
+        refs = CrossReferenceValidator(str(self.skill)).list_all_references()
+        self.assertEqual(refs['valid'], ['references/guide.md'])
+        self.assertEqual(refs['missing'], ['references/gone.md'])
+        self.assertEqual(refs['orphaned'], ['references/deep/extra.md'])
+
+    def test_single_file_skill(self):
+        skill = self.skill / "references" / "deep"
+        (skill / "extra.md").rename(skill / "SKILL.md")
+        refs = CrossReferenceValidator(str(skill)).list_all_references()
+        self.assertEqual(refs['orphaned'], [])
+
+
+class SharedFileListTest(SkillTreeTestCase):
+    """validate_skill_md() given the packager's walk matches its own scan."""
+
+    def test_packager_files_match_own_scan(self):
+        validator = CrossReferenceValidator(str(self.skill))
+        files = list(_scandir_files(self.skill))
+        self.assertEqual(validator.validate_skill_md(files).to_dict(),
+                         validator.validate_skill_md().to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()